@@ -0,0 +1,220 @@
+"""
+Sudoku kıyaslama aracı - arayüzsüz çalışır, sonuçları JSON olarak yazar
+
+Kullanım:
+    python bench.py                          # tüm çözücüler, tüm kategoriler
+    python bench.py --backends dlx bitmask --repeat 5 --out sonuc.json
+    python bench.py --generate 20            # üretim süresini de ölç
+
+Bulmacalar sürümlü bench_corpus.txt dosyasından okunur (easy, hard ve
+düz geri izlemeyi zorlayan adversarial bulmacalar).
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+from engine import BitBoard, DancingLinks, SolveStats, SudokuEngine, generate_seeded
+
+CORPUS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bench_corpus.txt')
+NAIVE_NODE_LIMIT = 200000  # is_safe ile düz geri izleme bu kadar düğümde kesilir
+GENERATE_SEED = 1000
+
+_engine = SudokuEngine()  # Yalnızca is_safe için; her çözümde yeniden kurulmaz
+
+
+class _NodeLimit(Exception):
+    """Düz geri izleme düğüm sınırını aştı"""
+
+
+def load_corpus(path=CORPUS_PATH):
+    """(sürüm, {kategori: [tahta, ...]}) döndür"""
+    version, puzzles = None, {}
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            key, value = line.split()
+            if key == 'version':
+                version = int(value)
+                continue
+            board = [[0 if ch == '.' else int(ch) for ch in value[r * 9:r * 9 + 9]]
+                     for r in range(9)]
+            puzzles.setdefault(key, []).append(board)
+    return version, puzzles
+
+
+def naive_solve(board, limit=NAIVE_NODE_LIMIT):
+    """Oyunun is_safe kontrolüyle satır satır geri izleme; (çözüldü mü, düğüm)"""
+    is_safe = _engine.is_safe
+    empties = [(r, c) for r in range(9) for c in range(9) if board[r][c] == 0]
+    nodes = 0
+
+    def fill(i):
+        nonlocal nodes
+        nodes += 1
+        if nodes > limit:
+            raise _NodeLimit
+        if i == len(empties):
+            return True
+        r, c = empties[i]
+        for num in range(1, 10):
+            if is_safe(board, r, c, num):
+                board[r][c] = num
+                if fill(i + 1):
+                    return True
+        board[r][c] = 0
+        return False
+
+    try:
+        return fill(0), nodes
+    except _NodeLimit:
+        return None, nodes
+
+
+def bitmask_solve(board):
+    bits = BitBoard(board)
+    return bits.solve_mrv(), bits.nodes
+
+
+def dlx_solve(board):
+    dlx = DancingLinks(board)
+    return bool(dlx.solutions(limit=1)), dlx.nodes
+
+
+BACKENDS = {
+    'naive': naive_solve,
+    'bitmask': bitmask_solve,
+    'dlx': dlx_solve,
+}
+
+
+def percentile(values, p):
+    """Sıralı listeden en yakın sıra yöntemiyle yüzdelik"""
+    if not values:
+        return 0.0
+    k = max(0, min(len(values) - 1, round(p / 100 * len(values) + 0.5) - 1))
+    return values[k]
+
+
+def summarize(times, peak):
+    times = sorted(times)
+    total = sum(times)
+    return {
+        'runs': len(times),
+        'per_sec': round(len(times) / total, 1) if total else None,
+        'p50_ms': round(percentile(times, 50) * 1000, 3),
+        'p99_ms': round(percentile(times, 99) * 1000, 3),
+        'peak_kib': round(peak / 1024, 1),
+    }
+
+
+def peak_memory(func, items):
+    """Her öğe için func çalışırken ayrılan en yüksek ek bellek (bayt)
+
+    Çözücü kapanışları döngüsel referans bırakır; önceki çöp sayılmasın diye
+    her öğeden önce toplanır ve o anki kullanım taban olarak düşülür.
+    """
+    tracemalloc.start()
+    peak = 0
+    for item in items:
+        gc.collect()
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        func(item)
+        peak = max(peak, tracemalloc.get_traced_memory()[1] - baseline)
+    tracemalloc.stop()
+    return peak
+
+
+def bench_solve(backend, boards, repeat):
+    solve = BACKENDS[backend]
+    times, nodes = [], 0
+    solved = aborted = 0
+    for board in boards:
+        for _ in range(repeat):
+            copy = [row[:] for row in board]
+            start = time.perf_counter()
+            ok, n = solve(copy)
+            times.append(time.perf_counter() - start)
+        nodes += n
+        if ok is None:
+            aborted += 1
+        elif ok:
+            solved += 1
+    # Bellek ölçümü zamanlamayı bozmasın diye ayrı bir turda yapılır
+    peak = peak_memory(lambda b: solve([row[:] for row in b]), boards)
+    result = summarize(times, peak)
+    result.update(puzzles=len(boards), solved=solved, aborted=aborted,
+                  nodes=nodes, nodes_mean=round(nodes / len(boards), 1))
+    return result
+
+
+def bench_generate(difficulty, count):
+    """Oyunun, havuzun ve derlemin kullandığı puanlı üretimi ölç"""
+    times = []
+    for i in range(count):
+        start = time.perf_counter()
+        generate_seeded(difficulty, GENERATE_SEED + i)
+        times.append(time.perf_counter() - start)
+    peak = peak_memory(lambda i: generate_seeded(difficulty, GENERATE_SEED + i),
+                       range(min(count, 3)))
+    # Aşama dağılımı ölçümlü ayrı bir turda toplanır
+    stats = SolveStats()
+    for i in range(count):
+        generate_seeded(difficulty, GENERATE_SEED + i, stats=stats)
+    result = summarize(times, peak)
+    result['stats'] = stats.as_dict()
+    return result
+
+
+def run(backends, categories=None, repeat=3, generate=0, path=CORPUS_PATH):
+    version, corpus = load_corpus(path)
+    report = {
+        'corpus_version': version,
+        'python': platform.python_version(),
+        'repeat': repeat,
+        'solve': {},
+    }
+    for backend in backends:
+        report['solve'][backend] = {}
+        for category, boards in corpus.items():
+            if categories and category not in categories:
+                continue
+            print(f"{backend} / {category}...", file=sys.stderr)
+            report['solve'][backend][category] = bench_solve(backend, boards, repeat)
+    if generate:
+        report['generate'] = {}
+        for difficulty in ('easy', 'medium', 'hard'):
+            print(f"üretim / {difficulty}...", file=sys.stderr)
+            report['generate'][difficulty] = bench_generate(difficulty, generate)
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sudoku çözücü ve üretici kıyaslaması")
+    parser.add_argument('--backends', nargs='+', choices=list(BACKENDS), default=list(BACKENDS))
+    parser.add_argument('--categories', nargs='+', default=None)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--generate', type=int, default=0, metavar='N',
+                        help="her zorluk için N bulmaca üretip süresini ölç")
+    parser.add_argument('--corpus', default=CORPUS_PATH)
+    parser.add_argument('--out', default=None, help="JSON dosyası (varsayılan: stdout)")
+    args = parser.parse_args(argv)
+
+    report = run(args.backends, args.categories, args.repeat, args.generate, args.corpus)
+    text = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""
+Sudoku tahtası çizicileri
+
+Her hücre için son uygulanan görünüm (arkaplan, metin, yazı rengi, notlar)
+saklanır; yalnızca değişen hücrelere Tk config çağrısı gönderilir.
+"""
+import bisect
+import tkinter as tk
+
+from engine import BOX
+
+# Kutu kenarına göre hücre boyutu (piksel); büyük tahtalar pencereye sığsın
+CELL_SIZES = {2: 70, 3: 55, 4: 38, 5: 28}
+
+
+def cell_fonts(cell_size, box):
+    """Hücre boyutuna göre (değer, not) yazı tipleri"""
+    return ('Arial', round(cell_size * 0.4), 'bold'), ('Arial', 7 if box <= BOX else 5)
+
+
+class WidgetBoard:
+    """Her hücresi Frame + Label olan klasik tahta"""
+
+    def __init__(self, parent, colors, on_click, box=BOX, cell_size=None):
+        size = box * box
+        cell_size = cell_size or CELL_SIZES.get(box, 30)
+        value_font, note_font = cell_fonts(cell_size, box)
+        self.colors = colors
+        self.size = size
+        self.cells = [[None]*size for _ in range(size)]
+        self.cell_frames = [[None]*size for _ in range(size)]
+        self.note_labels = [[None]*size for _ in range(size)]
+        # Son çizilen durum: (bg, text, fg, note_text)
+        self._state = [[None]*size for _ in range(size)]
+
+        self.frame = tk.Frame(parent, bg='#8b5cf6', padx=3, pady=3)
+
+        for r in range(size):
+            for c in range(size):
+                # Kalın kenarlıklar için frame
+                pad_x = (3 if c % box == 0 else 1, 3 if c % box == box - 1 else 1)
+                pad_y = (3 if r % box == 0 else 1, 3 if r % box == box - 1 else 1)
+
+                cell_container = tk.Frame(self.frame, bg='#8b5cf6')
+                cell_container.grid(row=r, column=c, padx=pad_x, pady=pad_y)
+
+                cell_frame = tk.Frame(
+                    cell_container,
+                    bg=colors['cell_bg'],
+                    width=cell_size,
+                    height=cell_size
+                )
+                cell_frame.pack_propagate(False)
+                cell_frame.pack()
+
+                # Sayı label
+                cell = tk.Label(
+                    cell_frame,
+                    text="",
+                    font=value_font,
+                    bg=colors['cell_bg'],
+                    fg=colors['text'],
+                    cursor='hand2'
+                )
+                cell.place(relx=0.5, rely=0.5, anchor='center')
+                cell.bind('<Button-1>', lambda e, row=r, col=c: on_click(row, col))
+                cell_frame.bind('<Button-1>', lambda e, row=r, col=c: on_click(row, col))
+
+                # Not label (küçük sayılar)
+                note_label = tk.Label(
+                    cell_frame,
+                    text="",
+                    font=note_font,
+                    bg=colors['cell_bg'],
+                    fg='#94a3b8',
+                    cursor='hand2'
+                )
+                note_label.place(x=2, y=2)
+                note_label.bind('<Button-1>', lambda e, row=r, col=c: on_click(row, col))
+
+                self.cells[r][c] = cell
+                self.cell_frames[r][c] = cell_frame
+                self.note_labels[r][c] = note_label
+
+    def pack(self, **kwargs):
+        self.frame.pack(**kwargs)
+
+    def render(self, row, col, bg, text, fg, note_text):
+        """Hücreyi çiz; önceki durumla aynı olan özellikler atlanır"""
+        old = self._state[row][col]
+        new = (bg, text, fg, note_text)
+        if old == new:
+            return False
+        if old is None or old[0] != bg:
+            self.cell_frames[row][col].config(bg=bg)
+            self.cells[row][col].config(bg=bg)
+            self.note_labels[row][col].config(bg=bg)
+        if old is None or old[1] != text or old[2] != fg:
+            self.cells[row][col].config(text=text, fg=fg)
+        if old is None or old[3] != note_text:
+            self.note_labels[row][col].config(text=note_text)
+        self._state[row][col] = new
+        return True
+
+
+class CanvasBoard:
+    """Tek bir Canvas üzerine çizilen tahta; tıklamalar koordinattan bulunur"""
+
+    def __init__(self, parent, colors, on_click, box=BOX, cell_size=None):
+        size = box * box
+        cell_size = cell_size or CELL_SIZES.get(box, 30)
+        value_font, note_font = cell_fonts(cell_size, box)
+        self.colors = colors
+        self.on_click = on_click
+        self.size = size
+        self.cell_size = cell_size
+        self._state = [[None]*size for _ in range(size)]
+
+        # Hücre başlangıçları; kalın/ince çizgiler widget tahtasıyla aynı aralıkta
+        self.offsets = []
+        pos = 3
+        for i in range(size):
+            pos += 3 if i % box == 0 else 1
+            self.offsets.append(pos)
+            pos += cell_size + (3 if i % box == box - 1 else 1)
+        width = pos + 3
+
+        self.canvas = tk.Canvas(parent, width=width, height=width, bg='#8b5cf6',
+                                highlightthickness=0, bd=0, cursor='hand2')
+        self.canvas.bind('<Button-1>', self._handle_click)
+
+        self.rects = [[None]*size for _ in range(size)]
+        self.texts = [[None]*size for _ in range(size)]
+        self.note_texts = [[None]*size for _ in range(size)]
+        for r in range(size):
+            y = self.offsets[r]
+            for c in range(size):
+                x = self.offsets[c]
+                self.rects[r][c] = self.canvas.create_rectangle(
+                    x, y, x + cell_size, y + cell_size,
+                    fill=colors['cell_bg'], width=0)
+                self.texts[r][c] = self.canvas.create_text(
+                    x + cell_size / 2, y + cell_size / 2, text="",
+                    font=value_font, fill=colors['text'])
+                self.note_texts[r][c] = self.canvas.create_text(
+                    x + 2, y + 2, text="", anchor='nw',
+                    font=note_font, fill='#94a3b8')
+
+    def pack(self, **kwargs):
+        self.canvas.pack(**kwargs)
+
+    def _cell_at(self, pos):
+        i = bisect.bisect_right(self.offsets, pos) - 1
+        if i < 0 or pos >= self.offsets[i] + self.cell_size:
+            return None  # Çizgi üzerine tıklandı
+        return i
+
+    def _handle_click(self, event):
+        row, col = self._cell_at(event.y), self._cell_at(event.x)
+        if row is not None and col is not None:
+            self.on_click(row, col)
+
+    def render(self, row, col, bg, text, fg, note_text):
+        """Hücreyi çiz; önceki durumla aynı olan öğeler atlanır"""
+        old = self._state[row][col]
+        new = (bg, text, fg, note_text)
+        if old == new:
+            return False
+        if old is None or old[0] != bg:
+            self.canvas.itemconfig(self.rects[row][col], fill=bg)
+        if old is None or old[1] != text or old[2] != fg:
+            self.canvas.itemconfig(self.texts[row][col], text=text, fill=fg)
+        if old is None or old[3] != note_text:
+            self.canvas.itemconfig(self.note_texts[row][col], text=note_text)
+        self._state[row][col] = new
+        return True
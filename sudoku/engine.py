@@ -0,0 +1,1210 @@
+"""
+Sudoku motoru - arayüz bağımlılığı yok
+
+Kullanım:
+    python engine.py generate --difficulty hard --count 100000 --seed 1 --out puzzles.txt
+    python engine.py show H3-1Z141Z
+"""
+import math
+import mmap
+import os
+import queue
+from collections import deque
+from itertools import islice
+from contextlib import contextmanager, nullcontext
+import random
+import struct
+import sys
+import threading
+import time
+
+from grader import GRADES, grade
+
+GRID_SIZE = 9
+BOX = 3  # Varsayılan kutu kenarı; tahta BOX*BOX x BOX*BOX (2 -> 4x4, 4 -> 16x16, 5 -> 25x25)
+SYMBOLS = '123456789ABCDEFGHIJKLMNOP'  # Hücre değeri v -> SYMBOLS[v - 1]
+HISTORY_LIMIT = 10000  # Geri alma günlüğünde tutulan en fazla değişiklik
+SAVE_HISTORY_LIMIT = 50  # Kayda yazılan en son geri alma/yineleme hamlesi
+CELLS_TO_REMOVE = {'easy': 35, 'medium': 45, 'hard': 55}  # 81 hücre için
+# 16x16 ve üstünde tekillik sayacının zorluğa göre düğüm sınırı. Sınır aşılınca
+# silme güvenli sayılmadığından bu tahtalarda orta ve zor hedefe ulaşamaz
+# (16x16 zor ~150/174, 25x25 zor ~290/424 hücre); zor daha geniş bütçeyle
+# ortadan fazla hücre siler. Bütçeyi artırmak süreyi hızla büyütür.
+LARGE_BOARD_NODE_BUDGET = {'easy': 50, 'medium': 50, 'hard': 200}
+SEED_BITS = 32  # Bulmaca kimliğine sığan tohum aralığı
+ID_DIGITS = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+SAVE_MAGIC = b'SDK\x01'  # Kayıt dosyası imzası ve biçim sürümü
+
+
+def cells_to_remove_for(difficulty, box=BOX):
+    """Zorluğun silme oranını tahta boyutuna ölçekle"""
+    cells = box ** 4
+    return round(CELLS_TO_REMOVE[difficulty] * cells / (GRID_SIZE * GRID_SIZE))
+
+
+def empty_grid(box=BOX):
+    size = box * box
+    return [[0]*size for _ in range(size)]
+
+
+class _SearchAborted(Exception):
+    """Arama düğüm bütçesini aştı"""
+
+
+class SolveStats:
+    """İsteğe bağlı arama ve üretim ölçümleri
+
+    Çözücülere ve üreticilere stats=... olarak verilir; None ise hiçbir şey
+    toplanmaz. Düğümler, geri almalar ve en büyük derinlik tüm aramalar
+    boyunca birikir. phases aşama başına saniyedir: fill (dolu tahta),
+    removal (hücre silme, solve dahil), solve (tekillik sayacı), grading.
+    """
+
+    def __init__(self):
+        self.searches = 0
+        self.nodes = 0
+        self.backtracks = 0
+        self.max_depth = 0
+        self.aborted = 0  # Düğüm bütçesini aşan aramalar
+        self.attempts = 0  # Puanlı üretimde denenen aday sayısı
+        self.phases = {}
+
+    def record(self, nodes, backtracks, depth):
+        self.searches += 1
+        self.nodes += nodes
+        self.backtracks += backtracks
+        if depth > self.max_depth:
+            self.max_depth = depth
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - start
+
+    def as_dict(self):
+        """Günlüğe yazmaya uygun düz sözlük"""
+        return {
+            'searches': self.searches,
+            'nodes': self.nodes,
+            'backtracks': self.backtracks,
+            'max_depth': self.max_depth,
+            'aborted': self.aborted,
+            'attempts': self.attempts,
+            'phases': {name: round(sec, 6) for name, sec in self.phases.items()},
+        }
+
+
+def _phase(stats, name):
+    return stats.phase(name) if stats is not None else nullcontext()
+
+
+class BitBoard:
+    """Satır/sütun/kutu bitmaskeleri ile artımlı aday takibi"""
+
+    def __init__(self, board, box=BOX, stats=None):
+        size = box * box
+        self.board = board
+        self.stats = stats
+        self.box = box
+        self.size = size
+        self.full = (1 << size) - 1  # Aday maskesi (bit 0 -> 1 rakamı)
+        self.rows = [0] * size
+        self.cols = [0] * size
+        self.boxes = [0] * size
+        self.valid = True  # Verilen rakamlar kendi aralarında çakışıyor mu
+        self.nodes = 0  # Aramalarda ziyaret edilen toplam düğüm sayısı
+        for r in range(size):
+            for c in range(size):
+                if board[r][c]:
+                    bit = 1 << (board[r][c] - 1)
+                    b = (r // box) * box + c // box
+                    if (self.rows[r] | self.cols[c] | self.boxes[b]) & bit:
+                        self.valid = False
+                    self.rows[r] |= bit
+                    self.cols[c] |= bit
+                    self.boxes[b] |= bit
+
+    def candidates(self, row, col):
+        """Hücreye konabilecek rakamların maskesi"""
+        b = (row // self.box) * self.box + col // self.box
+        return self.full & ~(self.rows[row] | self.cols[col] | self.boxes[b])
+
+    def place(self, row, col, num):
+        bit = 1 << (num - 1)
+        self.board[row][col] = num
+        self.rows[row] |= bit
+        self.cols[col] |= bit
+        self.boxes[(row // self.box) * self.box + col // self.box] |= bit
+
+    def remove(self, row, col):
+        bit = ~(1 << (self.board[row][col] - 1))
+        self.board[row][col] = 0
+        self.rows[row] &= bit
+        self.cols[col] &= bit
+        self.boxes[(row // self.box) * self.box + col // self.box] &= bit
+
+    def empty_cells(self):
+        return [(r, c) for r in range(self.size) for c in range(self.size)
+                if self.board[r][c] == 0]
+
+    def is_forced(self, row, col, num):
+        """Boş hücreye num tekli kurallarla (naked/hidden single) zorunlu mu"""
+        bit = 1 << (num - 1)
+        cands = self.candidates(row, col)
+        if cands == bit:
+            return True
+        if not cands & bit:
+            return False
+        box, board = self.box, self.board
+        br, bc = (row // box) * box, (col // box) * box
+        units = (
+            [(row, c) for c in range(self.size)],
+            [(r, col) for r in range(self.size)],
+            [(br + i // box, bc + i % box) for i in range(self.size)],
+        )
+        for unit in units:
+            if not any(board[r][c] == 0 and (r, c) != (row, col) and self.candidates(r, c) & bit
+                       for r, c in unit):
+                return True
+        return False
+
+    def solve(self, rng=None):
+        """Boş hücreleri sırayla doldur; rng verilirse rakamları rastgele sırada dene"""
+        if not self.valid:
+            return False
+        empties = self.empty_cells()
+        rows, cols, boxes = self.rows, self.cols, self.boxes
+        board, box, size = self.board, self.box, self.size
+        nodes = backtracks = depth = 0
+
+        def fill(i):
+            nonlocal nodes, backtracks, depth
+            nodes += 1
+            if i > depth:
+                depth = i
+            if i == len(empties):
+                return True
+            r, c = empties[i]
+            b = (r // box) * box + c // box
+            used = rows[r] | cols[c] | boxes[b]
+            digits = list(range(1, size + 1))
+            if rng is not None:
+                rng.shuffle(digits)
+            for num in digits:
+                bit = 1 << (num - 1)
+                if used & bit:
+                    continue
+                board[r][c] = num
+                rows[r] |= bit
+                cols[c] |= bit
+                boxes[b] |= bit
+                if fill(i + 1):
+                    return True
+                backtracks += 1
+                rows[r] &= ~bit
+                cols[c] &= ~bit
+                boxes[b] &= ~bit
+                board[r][c] = 0
+            return False
+
+        try:
+            return fill(0)
+        finally:
+            self.nodes += nodes
+            if self.stats is not None:
+                self.stats.record(nodes, backtracks, depth)
+
+    def solve_mrv(self):
+        """En az adayı olan hücreden dallanarak çöz (MRV)"""
+        return self._search_mrv(limit=1) == 1
+
+    def count_solutions(self, limit=2, max_nodes=None):
+        """Çözümleri limit'e ulaşınca durarak say; tahta değişmez
+
+        max_nodes aşılırsa arama kesilir ve None döner.
+        """
+        try:
+            return self.copy()._search_mrv(limit, max_nodes)
+        except _SearchAborted:
+            if self.stats is not None:
+                self.stats.aborted += 1
+            return None
+
+    def copy(self):
+        clone = BitBoard.__new__(BitBoard)
+        clone.box, clone.size, clone.full = self.box, self.size, self.full
+        clone.board = [row[:] for row in self.board]
+        clone.rows, clone.cols, clone.boxes = self.rows[:], self.cols[:], self.boxes[:]
+        clone.valid = self.valid
+        clone.nodes = 0
+        clone.stats = self.stats
+        return clone
+
+    def _search_mrv(self, limit, max_nodes=None):
+        """MRV araması; limit kadar çözüm bulununca tahtayı son çözümde bırakır"""
+        if not self.valid:
+            return 0
+        box, full = self.box, self.full
+        empties = [(r, c, (r // box) * box + c // box) for r, c in self.empty_cells()]
+        rows, cols, boxes = self.rows, self.cols, self.boxes
+        board = self.board
+        n = len(empties)
+        found = 0
+        budget = max_nodes
+        nodes = backtracks = depth = 0
+
+        def fill(i):
+            nonlocal found, budget, nodes, backtracks, depth
+            nodes += 1
+            if i > depth:
+                depth = i
+            if i == n:
+                found += 1
+                return found >= limit
+            if budget is not None:
+                budget -= 1
+                if budget < 0:
+                    raise _SearchAborted
+            # Kalan boş hücreler arasında en kısıtlı olanı bul ve i konumuna al
+            best, best_count, best_mask = i, full.bit_length() + 1, 0
+            for j in range(i, n):
+                r, c, b = empties[j]
+                mask = full & ~(rows[r] | cols[c] | boxes[b])
+                count = mask.bit_count()
+                if count < best_count:
+                    best, best_count, best_mask = j, count, mask
+                    if count <= 1:
+                        break
+            if best_count == 0:
+                return False
+            empties[i], empties[best] = empties[best], empties[i]
+            r, c, b = empties[i]
+            mask = best_mask
+            while mask:
+                bit = mask & -mask
+                mask ^= bit
+                board[r][c] = bit.bit_length()
+                rows[r] |= bit
+                cols[c] |= bit
+                boxes[b] |= bit
+                if fill(i + 1):
+                    return True
+                backtracks += 1
+                rows[r] &= ~bit
+                cols[c] &= ~bit
+                boxes[b] &= ~bit
+            board[r][c] = 0
+            return False
+
+        try:
+            fill(0)
+        finally:
+            self.nodes += nodes
+            if self.stats is not None:
+                self.stats.record(nodes, backtracks, depth)
+        return found
+
+
+class DancingLinks:
+    """Knuth'un Dancing Links (Algorithm X) tam örtü çözücüsü
+
+    Her satır bir (hücre, rakam) seçimi, her sütun bir kısıttır:
+    hücre dolu, satırda rakam, sütunda rakam, kutuda rakam (9x9 için 4 * 81 = 324).
+    Düğümler paralel listelerde tutulur; 0 numaralı düğüm köktür.
+    """
+
+    def __init__(self, board, box=BOX, stats=None):
+        n = box * box
+        self.n = n
+        self.stats = stats
+        cols = 4 * n * n
+        # Başlık düğümleri: 0 kök, 1..cols sütunlar
+        self.L = list(range(-1, cols))
+        self.L[0] = cols
+        self.R = list(range(1, cols + 2))
+        self.R[cols] = 0
+        self.U = list(range(cols + 1))
+        self.D = list(range(cols + 1))
+        self.C = list(range(cols + 1))
+        self.row_of = [-1] * (cols + 1)
+        self.size = [0] * (cols + 1)
+        self.valid = True
+        self.nodes = 0  # Aramalarda ziyaret edilen toplam düğüm sayısı
+
+        first_of_row = {}
+        for r in range(n):
+            for c in range(n):
+                b = (r // box) * box + c // box
+                for d in range(n):
+                    rid = (r * n + c) * n + d
+                    first_of_row[rid] = self._add_row(rid, (
+                        1 + r * n + c,
+                        1 + n * n + r * n + d,
+                        1 + 2 * n * n + c * n + d,
+                        1 + 3 * n * n + b * n + d,
+                    ))
+
+        # Verilen rakamları baştan seç; sütunu zaten örtülmüşse tahta geçersiz
+        self.given = []
+        covered = set()
+        for r in range(n):
+            for c in range(n):
+                if board[r][c]:
+                    rid = (r * n + c) * n + board[r][c] - 1
+                    node = first_of_row[rid]
+                    row_cols = [self.C[node], self.C[self.R[node]],
+                                self.C[self.R[self.R[node]]], self.C[self.L[node]]]
+                    if covered.intersection(row_cols):
+                        self.valid = False
+                        return
+                    covered.update(row_cols)
+                    for col in row_cols:
+                        self._cover(col)
+                    self.given.append(rid)
+
+    def _add_row(self, rid, columns):
+        L, R, U, D, C = self.L, self.R, self.U, self.D, self.C
+        first = len(L)
+        for i, col in enumerate(columns):
+            node = first + i
+            L.append(first + (i - 1) % len(columns))
+            R.append(first + (i + 1) % len(columns))
+            U.append(U[col])
+            D.append(col)
+            C.append(col)
+            self.row_of.append(rid)
+            D[U[col]] = node
+            U[col] = node
+            self.size[col] += 1
+        return first
+
+    def _cover(self, col):
+        L, R, U, D, C, size = self.L, self.R, self.U, self.D, self.C, self.size
+        R[L[col]] = R[col]
+        L[R[col]] = L[col]
+        i = D[col]
+        while i != col:
+            j = R[i]
+            while j != i:
+                D[U[j]] = D[j]
+                U[D[j]] = U[j]
+                size[C[j]] -= 1
+                j = R[j]
+            i = D[i]
+
+    def _uncover(self, col):
+        L, R, U, D, C, size = self.L, self.R, self.U, self.D, self.C, self.size
+        i = U[col]
+        while i != col:
+            j = L[i]
+            while j != i:
+                size[C[j]] += 1
+                D[U[j]] = j
+                U[D[j]] = j
+                j = L[j]
+            i = U[i]
+        R[L[col]] = col
+        L[R[col]] = col
+
+    def solutions(self, limit=1):
+        """En fazla limit adet çözümü tahta olarak döndür"""
+        found = []
+        if not self.valid:
+            return found
+        R, D, C, size = self.R, self.D, self.C, self.size
+        partial = []
+        nodes = backtracks = depth = 0
+
+        def search():
+            nonlocal nodes, backtracks, depth
+            nodes += 1
+            if len(partial) > depth:
+                depth = len(partial)
+            col = R[0]
+            if col == 0:
+                found.append(self._to_board(self.given + partial))
+                return len(found) >= limit
+            # En az düğümlü sütunu seç
+            best, best_size = col, size[col]
+            while col != 0 and best_size > 1:
+                if size[col] < best_size:
+                    best, best_size = col, size[col]
+                col = R[col]
+            if best_size == 0:
+                return False
+            self._cover(best)
+            i = D[best]
+            while i != best:
+                partial.append(self.row_of[i])
+                j = R[i]
+                while j != i:
+                    self._cover(C[j])
+                    j = R[j]
+                done = search()
+                j = self.L[i]
+                while j != i:
+                    self._uncover(C[j])
+                    j = self.L[j]
+                partial.pop()
+                if done:
+                    self._uncover(best)
+                    return True
+                backtracks += 1
+                i = D[i]
+            self._uncover(best)
+            return False
+
+        search()
+        self.nodes += nodes
+        if self.stats is not None:
+            self.stats.record(nodes, backtracks, depth)
+        return found
+
+    def count(self, limit=2):
+        """Çözüm sayısını limit'e kadar say"""
+        return len(self.solutions(limit))
+
+    def _to_board(self, rids):
+        n = self.n
+        board = [[0] * n for _ in range(n)]
+        for rid in rids:
+            cell, d = divmod(rid, n)
+            board[cell // n][cell % n] = d + 1
+        return board
+
+
+def fill_grid(box=BOX, rng=random, stats=None):
+    """Rastgele dolu bir çözüm tahtası üret
+
+    9x9 ve küçüğünde rastgele sıralı geri izleme kullanılır. Daha büyük
+    tahtalarda geri izleme takılabildiği için temel desen, bant/yığın ve
+    rakam karıştırmalarıyla dönüştürülür.
+    """
+    size = box * box
+    if box <= BOX:
+        board = empty_grid(box)
+        # Rakamları her hücrede karıştırarak tahtayı doldur
+        BitBoard(board, box, stats).solve(rng=rng)
+        return board
+
+    def shuffled_lines():
+        bands = rng.sample(range(box), box)
+        return [band * box + line for band in bands for line in rng.sample(range(box), box)]
+
+    rows, cols = shuffled_lines(), shuffled_lines()
+    digits = rng.sample(range(1, size + 1), size)
+    return [[digits[(box * (r % box) + r // box + c) % size] for c in cols] for r in rows]
+
+
+def generate_puzzle(difficulty, unique=True, rng=random, cells_to_remove=None, box=BOX,
+                    stats=None):
+    """Zorluğa göre (bulmaca, çözüm) üret; zorluk yalnızca silinen hücre sayısıdır"""
+    size = box * box
+    with _phase(stats, 'fill'):
+        board = fill_grid(box, rng, stats)
+    solution = [row[:] for row in board]
+
+    # Hücreleri çıkar
+    if cells_to_remove is None:
+        cells_to_remove = cells_to_remove_for(difficulty, box)
+    cells = [(r, c) for r in range(size) for c in range(size)]
+    rng.shuffle(cells)
+
+    if not unique:
+        for i in range(min(cells_to_remove, len(cells))):
+            r, c = cells[i]
+            board[r][c] = 0
+        return board, solution
+
+    # Tek çözümlü kalacak şekilde hücreleri birer birer çıkar. Büyük tahtalarda
+    # sayaç bir düğüm bütçesiyle çalışır; bütçeyi aşan silme güvenli sayılmaz.
+    bits = BitBoard(board, box, stats)
+    max_nodes = None if box <= BOX else LARGE_BOARD_NODE_BUDGET[difficulty]
+    removed = 0
+    with _phase(stats, 'removal'):
+        for r, c in cells:
+            if removed == cells_to_remove:
+                break
+            val = board[r][c]
+            bits.remove(r, c)
+            # Tekli kurallarla geri bulunabilen hücreyi çıkarmak çözüm sayısını değiştirmez
+            if bits.is_forced(r, c, val):
+                removed += 1
+                continue
+            with _phase(stats, 'solve'):
+                count = bits.count_solutions(limit=2, max_nodes=max_nodes)
+            if count == 1:
+                removed += 1
+            else:
+                bits.place(r, c, val)
+
+    return board, solution
+
+
+def generate_graded_puzzle(difficulty, rng=random, max_attempts=200, box=BOX, stats=None):
+    """Puanlayıcı aynı sınıfı verene kadar aday üret
+
+    Orta ve zor sınıflar için adaylar en çok hücre silinerek üretilir;
+    hangi sınıfa düştüklerine kullanılan teknikler karar verir.
+    max_attempts dolarsa sınıfı en yakın aday döner. 9x9 dışındaki
+    tahtalarda zorluk silinen hücre sayısıyla belirlenir; bu tahtalarda
+    hedef sayıya ulaşılamayabilir (bkz. LARGE_BOARD_NODE_BUDGET).
+    """
+    if box != BOX:
+        return generate_puzzle(difficulty, rng=rng, box=box, stats=stats)
+    target = GRADES.index(difficulty)
+    remove = cells_to_remove_for('easy' if difficulty == 'easy' else 'hard', box)
+    best, best_gap = None, None
+    for _ in range(max_attempts):
+        if stats is not None:
+            stats.attempts += 1
+        board, solution = generate_puzzle(difficulty, rng=rng, cells_to_remove=remove, box=box,
+                                          stats=stats)
+        with _phase(stats, 'grading'):
+            gap = abs(GRADES.index(grade(board, box)[0]) - target)
+        if gap == 0:
+            return board, solution
+        if best is None or gap < best_gap:
+            best, best_gap = (board, solution), gap
+    return best
+
+
+# Derlem kaydı: bulmaca(n*n) boşluk çözüm(n*n) boşluk zorluk(e/m/h) boşluk tohum(10) \n
+# Hücreler SYMBOLS ile yazılır, boş hücre '0'; 9x9 kaydı 177 bayttır.
+DIFFICULTY_CODES = {'easy': 'e', 'medium': 'm', 'hard': 'h'}
+DIFFICULTY_NAMES = {v: k for k, v in DIFFICULTY_CODES.items()}
+SYMBOL_VALUES = {ch: i + 1 for i, ch in enumerate(SYMBOLS)}
+SYMBOL_VALUES['0'] = 0
+
+
+def record_size(box=BOX):
+    return 2 * box ** 4 + 15
+
+
+def encode_grid(board):
+    return ''.join(SYMBOLS[v - 1] if v else '0' for row in board for v in row)
+
+
+def encode_record(board, solution, difficulty, seed):
+    return (f"{encode_grid(board)} {encode_grid(solution)} "
+            f"{DIFFICULTY_CODES[difficulty]} {seed % 10**10:010d}\n").encode('ascii')
+
+
+def decode_grid(text, box=BOX):
+    size = box * box
+    return [[SYMBOL_VALUES[ch] for ch in text[r * size:(r + 1) * size]] for r in range(size)]
+
+
+def puzzle_id(seed, difficulty, box=BOX):
+    """Tohum, zorluk ve kutu boyutundan kısa kimlik; örn. 'H3-1Z141Z'"""
+    digits = ''
+    while True:
+        seed, d = divmod(seed, len(ID_DIGITS))
+        digits = ID_DIGITS[d] + digits
+        if not seed:
+            break
+    return f"{DIFFICULTY_CODES[difficulty].upper()}{box}-{digits}"
+
+
+def parse_puzzle_id(text):
+    """Kimliği (tohum, zorluk, kutu) olarak çöz; geçersizse ValueError"""
+    head, _, digits = text.strip().upper().partition('-')
+    if (len(head) != 2 or head[0].lower() not in DIFFICULTY_NAMES or head[1] not in '2345'
+            or not digits or any(ch not in ID_DIGITS for ch in digits)):
+        raise ValueError(f"geçersiz bulmaca kimliği: {text!r}")
+    seed = int(digits, len(ID_DIGITS))
+    if seed >= 1 << SEED_BITS:
+        raise ValueError(f"geçersiz bulmaca kimliği: {text!r}")
+    return seed, DIFFICULTY_NAMES[head[0].lower()], int(head[1])
+
+
+def generate_seeded(difficulty, seed, box=BOX, stats=None):
+    """Tohumdan puanlı bulmaca üret: (bulmaca, çözüm, kimlik); aynı tohum hep aynı tahtayı verir"""
+    board, solution = generate_graded_puzzle(difficulty, rng=random.Random(seed), box=box,
+                                             stats=stats)
+    return board, solution, puzzle_id(seed, difficulty, box)
+
+
+def generate_from_id(text, stats=None):
+    """Kimlikteki tohum, zorluk ve boyutla bulmacayı yeniden üret"""
+    seed, difficulty, box = parse_puzzle_id(text)
+    return generate_seeded(difficulty, seed, box, stats)
+
+
+class PuzzleCorpus:
+    """Sabit uzunluklu kayıtlardan oluşan derlem dosyası; mmap ile tembel okunur
+
+    Tahta boyutu ilk kaydın uzunluğundan anlaşılır.
+    """
+
+    def __init__(self, path):
+        self._file = open(path, 'rb')
+        try:
+            if os.fstat(self._file.fileno()).st_size == 0:
+                raise ValueError(f"derlem dosyası boş: {path}")
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            # İlk kaydın uzunluğu bilinen bir tahta boyutuna uymalı
+            length = self._map.find(b'\n') + 1
+            box = next((b for b in (2, 3, 4, 5) if record_size(b) == length), None)
+            if box is None or self._map.find(b' ') != box ** 4:
+                self._map.close()
+                raise ValueError(f"tanınmayan derlem dosyası: {path}")
+        except ValueError:
+            self._file.close()
+            raise
+        self.box = box
+        self._cells = box ** 4
+        self._record = record_size(box)
+
+    def __len__(self):
+        return len(self._map) // self._record
+
+    def __getitem__(self, index):
+        """index'teki kaydı (bulmaca, çözüm, zorluk, tohum) olarak döndür"""
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        size = self._record
+        record = self._map[index * size:(index + 1) * size].decode('ascii')
+        n = self._cells
+        return (decode_grid(record[:n], self.box), decode_grid(record[n + 1:2 * n + 1], self.box),
+                DIFFICULTY_NAMES[record[2 * n + 2]], int(record[2 * n + 4:2 * n + 14]))
+
+    def difficulty_at(self, index):
+        return DIFFICULTY_NAMES[chr(self._map[index * self._record + 2 * self._cells + 2])]
+
+    def pick(self, difficulty, rng=random, attempts=64):
+        """Rastgele bir kayıt seç: (bulmaca, çözüm, kimlik); yalnızca zorluk baytı okunur"""
+        total = len(self)
+        if not total:
+            return None
+        start = rng.randrange(total)
+        for i in range(attempts):
+            index = rng.randrange(total) if i else start
+            if self.difficulty_at(index) == difficulty:
+                board, solution, _, seed = self[index]
+                return board, solution, puzzle_id(seed, difficulty, self.box)
+        # Rastgele denemeler tutmadıysa sırayla tara
+        for offset in range(total):
+            index = (start + offset) % total
+            if self.difficulty_at(index) == difficulty:
+                board, solution, _, seed = self[index]
+                return board, solution, puzzle_id(seed, difficulty, self.box)
+        return None
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+
+def _generate_chunk(difficulty, seeds, box=BOX):
+    """Süreç havuzunda çalışır: her tohum için bir kayıt üret"""
+    out = []
+    for seed in seeds:
+        board, solution, _ = generate_seeded(difficulty, seed, box)
+        out.append(encode_record(board, solution, difficulty, seed))
+    return b''.join(out)
+
+
+def generate_corpus(path, difficulty, count, seed=0, workers=None, chunk=None, box=BOX):
+    """count bulmacayı süreçlere dağıtarak üret ve geldikçe dosyaya yaz"""
+    from concurrent.futures import ProcessPoolExecutor
+
+    if chunk is None:
+        # Çekirdek başına birkaç parça düşsün; küçük derlemlerde de tüm çekirdekler çalışır
+        chunk = max(1, min(256, count // ((workers or os.cpu_count() or 1) * 4)))
+    chunks = [range(s, min(s + chunk, seed + count)) for s in range(seed, seed + count, chunk)]
+    done = 0
+    start = time.perf_counter()
+    with open(path, 'wb') as out, ProcessPoolExecutor(max_workers=workers) as executor:
+        for data in executor.map(_generate_chunk, [difficulty] * len(chunks), chunks,
+                                 [box] * len(chunks)):
+            out.write(data)
+            done += len(data) // record_size(box)
+            rate = done / (time.perf_counter() - start)
+            print(f"\r{done}/{count} bulmaca ({rate:.0f}/sn)", end='', file=sys.stderr, flush=True)
+    print(file=sys.stderr)
+    return done
+
+
+class PuzzlePool:
+    """Zorluk başına hazır bulmaca kuyrukları; arka plan iş parçacığı doldurur"""
+
+    def __init__(self, size=3, difficulties=('easy', 'medium', 'hard'), box=BOX):
+        self.box = box
+        self.queues = {d: queue.Queue(maxsize=size) for d in difficulties}
+        self._rng = random.Random()  # Yalnızca tohum seçer; bulmacalar tohumdan üretilir
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='puzzle-pool', daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stopped.set()
+        self._wake.set()
+
+    def get(self, difficulty):
+        """Hazır bulmacayı al; kuyruk boşsa None döner ve üretici uyandırılır"""
+        try:
+            puzzle = self.queues[difficulty].get_nowait()
+        except queue.Empty:
+            puzzle = None
+        self._wake.set()
+        return puzzle
+
+    def _run(self):
+        while not self._stopped.is_set():
+            produced = False
+            for difficulty, q in self.queues.items():
+                if not q.full():
+                    q.put(generate_seeded(difficulty, self._rng.getrandbits(SEED_BITS), self.box))
+                    produced = True
+            if not produced:
+                # Bütün kuyruklar dolu; biri tüketilene kadar bekle
+                self._wake.wait()
+                self._wake.clear()
+
+
+def _solve_in_process(conn, board, box, backend):
+    """Ayrı süreçte çalışır: çözülmüş tahtayı ya da çözüm yoksa None gönderir"""
+    solved = SudokuEngine(box=box).solve(board, backend)
+    conn.send(board if solved else None)
+    conn.close()
+
+
+class SolveTask:
+    """Tahtayı ayrı bir süreçte çözer; arayüz poll() ile sonucu yoklar
+
+    Arama ayrı süreçte olduğu için arayüz iş parçacığı (ve GIL) meşgul
+    olmaz. cancel() ya da süre aşımı süreci sonlandırır. state: running,
+    done, cancelled, timeout ya da failed (süreç sonuç göndermeden öldü).
+    """
+
+    def __init__(self, board, box=BOX, backend='bitmask', timeout=None):
+        import multiprocessing
+
+        # fork yerine spawn: Tk ve havuz iş parçacıkları çocuk sürece kopyalanmaz
+        ctx = multiprocessing.get_context('spawn')
+        self._conn, child = ctx.Pipe(duplex=False)
+        self._process = ctx.Process(target=_solve_in_process, daemon=True,
+                                    args=(child, [row[:] for row in board], box, backend))
+        self._process.start()
+        child.close()
+        self.deadline = None if timeout is None else time.monotonic() + timeout
+        self.state = 'running'
+        self.result = None
+
+    def poll(self):
+        """Görev bittiyse True; sonuç hazırsa result doldurulur"""
+        if self.state != 'running':
+            return True
+        if self._conn.poll():
+            try:
+                self.result = self._conn.recv()
+                self.state = 'done'
+            except EOFError:
+                self.state = 'failed'
+            self._conn.close()
+            self._process.join(timeout=1)
+            return True
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            self._stop('timeout')
+            return True
+        return False
+
+    def cancel(self):
+        if self.state == 'running':
+            self._stop('cancelled')
+
+    def _stop(self, state):
+        self.state = state
+        self._process.terminate()
+        self._process.join(timeout=1)
+        self._conn.close()
+
+
+class _BitWriter:
+    """Değerleri en düşük bitten başlayarak bayt dizisine paketler"""
+
+    def __init__(self):
+        self.out = bytearray()
+        self._acc = 0
+        self._bits = 0
+
+    def write(self, value, bits):
+        self._acc |= value << self._bits
+        self._bits += bits
+        while self._bits >= 8:
+            self.out.append(self._acc & 0xFF)
+            self._acc >>= 8
+            self._bits -= 8
+
+    def getvalue(self):
+        if self._bits:
+            return bytes(self.out) + bytes([self._acc])
+        return bytes(self.out)
+
+
+class _BitReader:
+    def __init__(self, data, pos=0):
+        self._data = data
+        self._pos = pos
+        self._acc = 0
+        self._bits = 0
+
+    def read(self, bits):
+        while self._bits < bits:
+            if self._pos >= len(self._data):
+                raise ValueError("kayıt dosyası eksik")
+            self._acc |= self._data[self._pos] << self._bits
+            self._pos += 1
+            self._bits += 8
+        value = self._acc & ((1 << bits) - 1)
+        self._acc >>= bits
+        self._bits -= bits
+        return value
+
+
+class SudokuEngine:
+    """Arayüzden bağımsız oyun durumu: üretim, çözüm, doğrulama ve ipucu"""
+
+    def __init__(self, difficulty='medium', box=BOX):
+        self.difficulty = difficulty
+        self.box = box
+        self.size = box * box
+        self.board = empty_grid(box)
+        self.initial_board = empty_grid(box)
+        self.solution = empty_grid(box)
+        self.puzzle_id = None  # Tohumdan üretilen bulmacalarda paylaşılabilir kimlik
+        # Notlar hücre başına size bitlik maske (bit 0 -> 1 rakamı)
+        self.notes = empty_grid(box)
+        # Değişiklik günlüğü: hamle başına (satır, sütun, eski, yeni) farklarının demeti;
+        # eski/yeni = (değer, not maskesi, sabit mi)
+        self.history = deque(maxlen=HISTORY_LIMIT)
+        self.redo_stack = []
+        # Birim başına rakam sayıları; hamlelerle birlikte güncellenir
+        self._row_counts = self._col_counts = self._box_counts = None
+        # Dolu hücre sayısı ve birimlerdeki fazlalık rakam sayısı (kazanma kontrolü için)
+        self.filled = 0
+        self.duplicates = 0
+        # Her hücrenin komşuları (aynı satır, sütun ya da kutu)
+        size = self.size
+        self._peers = [[[(r, col) for col in range(size) if col != c] +
+                        [(row, c) for row in range(size) if row != r] +
+                        [(row, col)
+                         for row in range(r // box * box, r // box * box + box)
+                         for col in range(c // box * box, c // box * box + box)
+                         if row != r and col != c]
+                        for c in range(size)] for r in range(size)]
+        self._reset_counts()
+
+    def generate(self, unique=True, graded=True, stats=None, seed=None):
+        """(bulmaca, çözüm, kimlik) üret; kimlik yalnızca puanlı üretimde verilir"""
+        if seed is None:
+            seed = random.getrandbits(SEED_BITS)
+        if graded and unique:
+            return generate_seeded(self.difficulty, seed, self.box, stats)
+        board, solution = generate_puzzle(self.difficulty, unique, rng=random.Random(seed),
+                                          box=self.box, stats=stats)
+        return board, solution, None
+
+    def new_game(self, puzzle=None):
+        """Verilen (bulmaca, çözüm, kimlik) üçlüsünü ya da yeni üretileni yükle"""
+        board, solution, self.puzzle_id = puzzle or self.generate()
+        self.board = [row[:] for row in board]
+        self.solution = [row[:] for row in solution]
+        self.initial_board = [row[:] for row in board]
+        self.notes = empty_grid(self.box)
+        self.history.clear()
+        self.redo_stack.clear()
+        self._reset_counts()
+
+    def _reset_counts(self):
+        size = self.size
+        self._row_counts = [[0] * (size + 1) for _ in range(size)]
+        self._col_counts = [[0] * (size + 1) for _ in range(size)]
+        self._box_counts = [[0] * (size + 1) for _ in range(size)]
+        self.filled = 0
+        self.duplicates = 0
+        for r in range(size):
+            for c in range(size):
+                if self.board[r][c]:
+                    self._count(r, c, self.board[r][c], 1)
+                    self.filled += 1
+
+    def _count(self, row, col, val, delta):
+        """val rakamının satır/sütun/kutu sayılarını delta kadar değiştir"""
+        b = (row // self.box) * self.box + col // self.box
+        for counts, i in ((self._row_counts, row), (self._col_counts, col),
+                          (self._box_counts, b)):
+            n = counts[i][val] + delta
+            counts[i][val] = n
+            # Birimdeki ikinci ve sonraki kopyalar birer çakışma sayılır
+            if delta > 0 and n > 1 or delta < 0 and n > 0:
+                self.duplicates += delta
+
+    def is_safe(self, board, row, col, num):
+        box = self.box
+        for i in range(self.size):
+            if board[row][i] == num or board[i][col] == num:
+                return False
+        box_row, box_col = (row // box) * box, (col // box) * box
+        for r in range(box_row, box_row + box):
+            for c in range(box_col, box_col + box):
+                if board[r][c] == num:
+                    return False
+        return True
+
+    def solve(self, board, backend='bitmask', stats=None):
+        """Tahtayı yerinde çöz; çözüm yoksa False"""
+        if backend == 'dlx':
+            found = DancingLinks(board, self.box, stats).solutions(limit=1)
+            if not found:
+                return False
+            for r in range(self.size):
+                board[r][:] = found[0][r]
+            return True
+        return BitBoard(board, self.box, stats).solve_mrv()
+
+    def validate(self):
+        """Tahtada çakışma yoksa ve hâlâ çözülebiliyorsa True"""
+        return BitBoard([row[:] for row in self.board], self.box).solve_mrv()
+
+    def is_given(self, row, col):
+        return self.initial_board[row][col] != 0
+
+    def _cell(self, row, col):
+        return self.board[row][col], self.notes[row][col], self.is_given(row, col)
+
+    def _apply(self, row, col, cell):
+        val, mask, given = cell
+        old = self.board[row][col]
+        if old != val:
+            if old:
+                self._count(row, col, old, -1)
+                self.filled -= 1
+            if val:
+                self._count(row, col, val, 1)
+                self.filled += 1
+        self.board[row][col] = val
+        self.notes[row][col] = mask
+        self.initial_board[row][col] = val if given else 0
+
+    def _change(self, row, col, val, mask, given=False):
+        """Hücreyi değiştir; farkı (satır, sütun, eski, yeni) olarak döndür"""
+        old = self._cell(row, col)
+        new = (val, mask, given)
+        if old == new:
+            return None
+        self._apply(row, col, new)
+        return row, col, old, new
+
+    def _record(self, deltas):
+        """Bir hamlenin farklarını tek kayıt olarak günlüğe yaz"""
+        deltas = tuple(d for d in deltas if d)
+        if not deltas:
+            return False
+        self.history.append(deltas)
+        self.redo_stack.clear()
+        return True
+
+    def _place(self, row, col, num, given=False):
+        """Rakamı yerleştir ve komşuların notlarından sil; farkları döndür"""
+        deltas = [self._change(row, col, num, 0, given)]
+        bit = 1 << (num - 1)
+        for r, c in self._peers[row][col]:
+            if self.notes[r][c] & bit:
+                deltas.append(self._change(r, c, self.board[r][c], self.notes[r][c] & ~bit,
+                                           self.is_given(r, c)))
+        return deltas
+
+    def is_conflict(self, row, col):
+        """Hücredeki rakam aynı satır, sütun ya da kutuda tekrar ediyorsa True"""
+        val = self.board[row][col]
+        if not val:
+            return False
+        b = (row // self.box) * self.box + col // self.box
+        return (self._row_counts[row][val] > 1 or self._col_counts[col][val] > 1
+                or self._box_counts[b][val] > 1)
+
+    def set_number(self, row, col, num, pencil=False):
+        """Hücreye rakam yaz ya da not ekle/çıkar; aynı rakam tekrar girilirse silinir"""
+        if self.is_given(row, col):
+            return False
+
+        val, mask = self.board[row][col], self.notes[row][col]
+        if pencil:
+            # Not modu
+            return self._record([self._change(row, col, val, mask ^ (1 << (num - 1)))])
+        # Normal mod
+        if val == num:
+            return self._record([self._change(row, col, 0, mask)])
+        return self._record(self._place(row, col, num))
+
+    def clear_cell(self, row, col):
+        if self.is_given(row, col):
+            return False
+        return self._record([self._change(row, col, 0, 0)])
+
+    def hint(self, row, col):
+        """Hücreyi çözümdeki rakamla doldurup sabitle"""
+        if self.is_given(row, col):
+            return None
+        self._record(self._place(row, col, self.solution[row][col], given=True))
+        return self.board[row][col]
+
+    def undo(self):
+        if not self.history:
+            return None
+        deltas = self.history.pop()
+        for row, col, old, new in reversed(deltas):
+            self._apply(row, col, old)
+        self.redo_stack.append(deltas)
+        return deltas[0][:2]
+
+    def redo(self):
+        if not self.redo_stack:
+            return None
+        deltas = self.redo_stack.pop()
+        for row, col, old, new in deltas:
+            self._apply(row, col, new)
+        self.history.append(deltas)
+        return deltas[0][:2]
+
+    # Kayıt biçimi: başlık (imza, kutu, zorluk, süre ms, kimlik) + bit akışı.
+    # Bit akışında hücre başına değer (9x9 için 4 bit), sabit bayrağı, çözüm ve
+    # not maskesi (size bit); ardından geri alma ve yineleme günlükleri gelir.
+
+    def _field_bits(self):
+        """(hücre indeksi, değer) alanlarının bit genişliği"""
+        return (self.size * self.size - 1).bit_length(), self.size.bit_length()
+
+    def to_bytes(self, elapsed=0.0, history_limit=SAVE_HISTORY_LIMIT):
+        """Oyun durumunu sıkıştırılmış ikili biçime çevir
+
+        Her hamlede yazıldığı için günlüklerin yalnızca son history_limit
+        hamlesi kaydedilir; kayıt boyutu ve süresi oyun uzadıkça büyümez.
+        """
+        pid = (self.puzzle_id or '').encode('ascii')
+        head = struct.pack('<4sBcIB', SAVE_MAGIC, self.box,
+                           DIFFICULTY_CODES[self.difficulty].encode('ascii'),
+                           round(elapsed * 1000), len(pid)) + pid
+        size = self.size
+        index_bits, value_bits = self._field_bits()
+        out = _BitWriter()
+        for r in range(size):
+            for c in range(size):
+                out.write(self.board[r][c], value_bits)
+                out.write(1 if self.initial_board[r][c] else 0, 1)
+                out.write(self.solution[r][c], value_bits)
+                out.write(self.notes[r][c], size)
+        for log in (self.history, self.redo_stack):
+            log = list(islice(reversed(log), history_limit))[::-1]
+            out.write(len(log), 32)
+            for deltas in log:
+                out.write(len(deltas), index_bits)
+                for row, col, old, new in deltas:
+                    out.write(row * size + col, index_bits)
+                    for val, mask, given in (old, new):
+                        out.write(val, value_bits)
+                        out.write(mask, size)
+                        out.write(1 if given else 0, 1)
+        return head + out.getvalue()
+
+    @classmethod
+    def from_bytes(cls, data):
+        """to_bytes çıktısından (motor, geçen süre sn) kur; bozuksa ValueError"""
+        fixed = struct.calcsize('<4sBcIB')
+        if len(data) < fixed:
+            raise ValueError("kayıt dosyası eksik")
+        magic, box, code, elapsed_ms, pid_len = struct.unpack_from('<4sBcIB', data)
+        if magic != SAVE_MAGIC or box not in (2, 3, 4, 5):
+            raise ValueError("tanınmayan kayıt dosyası")
+        difficulty = DIFFICULTY_NAMES.get(code.decode('ascii', 'replace'))
+        if difficulty is None:
+            raise ValueError("tanınmayan zorluk")
+        engine = cls(difficulty, box)
+        engine.puzzle_id = data[fixed:fixed + pid_len].decode('ascii') or None
+        size = engine.size
+        index_bits, value_bits = engine._field_bits()
+        bits = _BitReader(data, fixed + pid_len)
+
+        def read_value():
+            val = bits.read(value_bits)
+            if val > size:
+                raise ValueError("kayıtta geçersiz hücre değeri")
+            return val
+
+        for r in range(size):
+            for c in range(size):
+                engine.board[r][c] = read_value()
+                if bits.read(1):
+                    engine.initial_board[r][c] = engine.board[r][c]
+                engine.solution[r][c] = read_value()
+                engine.notes[r][c] = bits.read(size)
+        # Çözümü eksik kayıt oynanamaz (ör. bulmaca yüklenmeden yazılmış)
+        if any(not v for row in engine.solution for v in row):
+            raise ValueError("kayıtta çözüm eksik")
+        if any(given and given != engine.solution[r][c]
+               for r, row in enumerate(engine.initial_board) for c, given in enumerate(row)):
+            raise ValueError("kayıtta sabit hücre çözümle uyuşmuyor")
+        for log in (engine.history, engine.redo_stack):
+            for _ in range(bits.read(32)):
+                deltas = []
+                for _ in range(bits.read(index_bits)):
+                    index = bits.read(index_bits)
+                    if index >= size * size:
+                        raise ValueError("kayıtta geçersiz hücre indeksi")
+                    cells = tuple((read_value(), bits.read(size), bool(bits.read(1)))
+                                  for _ in range(2))
+                    deltas.append(divmod(index, size) + cells)
+                if not deltas:
+                    raise ValueError("kayıtta boş hamle")
+                log.append(tuple(deltas))
+        engine._reset_counts()
+        return engine, elapsed_ms / 1000
+
+    def is_solved(self):
+        """Tahta dolu ve hiçbir birimde tekrar yoksa True; herhangi bir geçerli çözüm kabul edilir"""
+        return self.filled == self.size * self.size and self.duplicates == 0
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Arayüzsüz Sudoku motoru")
+    sub = parser.add_subparsers(dest='command', required=True)
+    gen = sub.add_parser('generate', help="toplu bulmaca üret")
+    gen.add_argument('--difficulty', choices=list(DIFFICULTY_CODES), default='medium')
+    gen.add_argument('--count', type=int, default=1000)
+    gen.add_argument('--seed', type=int, default=0)
+    gen.add_argument('--workers', type=int, default=None)
+    gen.add_argument('--size', type=int, choices=[4, 9, 16, 25], default=GRID_SIZE)
+    gen.add_argument('--out', required=True)
+    show = sub.add_parser('show', help="kimlikteki bulmacayı yazdır")
+    show.add_argument('id')
+    args = parser.parse_args(argv)
+
+    if args.command == 'generate':
+        # Her kaydın tohumu bulmaca kimliğine sığmalı
+        if args.seed < 0 or args.seed + args.count > 1 << SEED_BITS:
+            parser.error(f"--seed ve --count 0..2^{SEED_BITS} aralığında kalmalı")
+        generate_corpus(args.out, args.difficulty, args.count, args.seed, args.workers,
+                        box=math.isqrt(args.size))
+    elif args.command == 'show':
+        try:
+            board, _, pid = generate_from_id(args.id)
+        except ValueError as exc:
+            parser.error(str(exc))
+        print(pid)
+        for row in board:
+            print(' '.join(SYMBOLS[v - 1] if v else '.' for v in row))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,79 @@
 import tkinter as tk
-from tkinter import messagebox
-import random
-import copy
-from datetime import datetime, timedelta
+from tkinter import messagebox, simpledialog
+import argparse
+import math
+import os
+import threading
+import time
+from concurrent.futures import Future
 
-GRID_SIZE = 9
-BOX = 3
+from board_view import CanvasBoard, WidgetBoard
+from engine import (BOX, SYMBOLS, PuzzleCorpus, PuzzlePool, SolveTask, SudokuEngine,
+                    generate_from_id, parse_puzzle_id)
+
+SOLVE_POLL_MS = 16  # Arka plan çözümünü yoklama aralığı (~60 fps)
+SOLVE_TIMEOUT = 10  # saniye
+SAVE_PATH = os.path.join(os.path.expanduser('~'), '.sudoku_save.bin')
+
+
+class GameTimer:
+    """time.monotonic() tabanlı oyun süresi
+
+    Süre yalnızca çalışırken birikir; duraklatma ve saat değişiklikleri
+    sayımı bozmaz. Tikler bir sonraki tam saniyeye hizalanır ve zamanlayıcı
+    durduğunda yeni tik planlanmaz.
+    """
+
+    def __init__(self, root, on_tick):
+        self.root = root
+        self.on_tick = on_tick
+        self._accumulated = 0.0
+        self._started = None  # Çalışıyorsa son başlatılma anı
+        self._after = None
+
+    @property
+    def running(self):
+        return self._started is not None
+
+    def elapsed(self):
+        if self._started is None:
+            return self._accumulated
+        return self._accumulated + time.monotonic() - self._started
+
+    def reset(self, elapsed=0.0):
+        self.stop()
+        self._accumulated = elapsed
+        self.on_tick(elapsed)
+
+    def start(self):
+        if self.running:
+            return
+        self._started = time.monotonic()
+        self._schedule()
+
+    def stop(self):
+        if not self.running:
+            return
+        self._accumulated = self.elapsed()
+        self._started = None
+        if self._after is not None:
+            self.root.after_cancel(self._after)
+            self._after = None
+
+    def _schedule(self):
+        delay = 1 - self.elapsed() % 1
+        self._after = self.root.after(max(1, math.ceil(delay * 1000)), self._tick)
+
+    def _tick(self):
+        self._after = None
+        if not self.running:
+            return
+        self.on_tick(self.elapsed())
+        self._schedule()
 
 class ModernSudoku:
-    def __init__(self, root):
+    def __init__(self, root, corpus=None, renderer='widgets', box=BOX, save_path=SAVE_PATH,
+                 resume=True):
         self.root = root
         root.title("Modern Sudoku")
         root.configure(bg='#1a1625')
@@ -31,26 +96,31 @@ class ModernSudoku:
             'button_hover': '#7c3aed',
         }
         
-        # Oyun verileri
-        self.board = [[0]*GRID_SIZE for _ in range(GRID_SIZE)]
-        self.initial_board = [[0]*GRID_SIZE for _ in range(GRID_SIZE)]
-        self.solution = [[0]*GRID_SIZE for _ in range(GRID_SIZE)]
+        # Oyun verileri motorda; burada yalnızca arayüz durumu tutulur
+        if corpus is not None:
+            box = corpus.box
+        self.box = box
+        self.size = box * box
+        self.engine = SudokuEngine(box=box)
         self.selected = None
-        self.difficulty = 'medium'
-        self.start_time = None
-        self.elapsed_time = 0
+        self.timer = GameTimer(root, self.show_time)
         self.is_paused = False
         self.pencil_mode = False
-        self.notes = [[set() for _ in range(GRID_SIZE)] for _ in range(GRID_SIZE)]
-        self.history = []
+        self.renderer = renderer
+        self.solve_task = None  # Ayrı süreçte süren çözüm
+        self.loaded = False  # İlk bulmaca gelene kadar tahta boş motoru gösterir
+        self.id_task = None  # Kimlikten arka planda üretilen bulmaca (Future)
+        self.save_path = save_path  # None ise otomatik kayıt kapalı
         
-        self.cells = [[None]*GRID_SIZE for _ in range(GRID_SIZE)]
-        self.cell_frames = [[None]*GRID_SIZE for _ in range(GRID_SIZE)]
-        self.note_labels = [[None]*GRID_SIZE for _ in range(GRID_SIZE)]
+        # Bulmacalar derlemden okunur ya da arka planda hazırlanır;
+        # açılış ilk üretimi beklemez
+        self.corpus = corpus
+        self.pool = None if corpus else PuzzlePool(box=box).start()
         
         self.create_ui()
-        self.new_game()
-        self.update_timer()
+        if not (resume and self.resume_game()):
+            self.wait_for_first_game()
+        self.root.protocol('WM_DELETE_WINDOW', self.on_close)
         
     def create_ui(self):
         # Ana container
@@ -94,7 +164,7 @@ class ModernSudoku:
                 difficulty_frame,
                 text=text,
                 font=('Arial', 10, 'bold'),
-                bg=self.colors['button_bg'] if diff == self.difficulty else self.colors['cell_bg'],
+                bg=self.colors['button_bg'] if diff == self.engine.difficulty else self.colors['cell_bg'],
                 fg=self.colors['text'],
                 activebackground=self.colors['button_hover'],
                 activeforeground=self.colors['text'],
@@ -119,81 +189,51 @@ class ModernSudoku:
         )
         self.timer_label.pack(side='right')
         
+        # Bulmaca kimliği; tıklanınca panoya kopyalanır
+        self.id_label = tk.Label(
+            top_panel,
+            text="",
+            font=('Arial', 10),
+            fg='#c4b5fd',
+            bg=self.colors['bg'],
+            padx=10,
+            cursor='hand2'
+        )
+        self.id_label.pack(side='right')
+        self.id_label.bind('<Button-1>', self.copy_puzzle_id)
+        
         # Oyun tahtası frame
         board_bg = tk.Frame(main_frame, bg=self.colors['cell_bg'], padx=15, pady=15)
         board_bg.pack(pady=(0, 15))
         
-        board_frame = tk.Frame(board_bg, bg='#8b5cf6', padx=3, pady=3)
-        board_frame.pack()
-        
-        # 9x9 grid oluştur
-        for r in range(GRID_SIZE):
-            for c in range(GRID_SIZE):
-                # Kalın kenarlıklar için frame
-                pad_x = (3 if c % 3 == 0 else 1, 3 if c % 3 == 2 else 1)
-                pad_y = (3 if r % 3 == 0 else 1, 3 if r % 3 == 2 else 1)
-                
-                cell_container = tk.Frame(board_frame, bg='#8b5cf6')
-                cell_container.grid(row=r, column=c, padx=pad_x, pady=pad_y)
-                
-                cell_frame = tk.Frame(
-                    cell_container,
-                    bg=self.colors['cell_bg'],
-                    width=55,
-                    height=55
-                )
-                cell_frame.pack_propagate(False)
-                cell_frame.pack()
-                
-                # Sayı label
-                cell = tk.Label(
-                    cell_frame,
-                    text="",
-                    font=('Arial', 22, 'bold'),
-                    bg=self.colors['cell_bg'],
-                    fg=self.colors['text'],
-                    cursor='hand2'
-                )
-                cell.place(relx=0.5, rely=0.5, anchor='center')
-                cell.bind('<Button-1>', lambda e, row=r, col=c: self.select_cell(row, col))
-                cell_frame.bind('<Button-1>', lambda e, row=r, col=c: self.select_cell(row, col))
-                
-                # Not label (küçük sayılar)
-                note_label = tk.Label(
-                    cell_frame,
-                    text="",
-                    font=('Arial', 7),
-                    bg=self.colors['cell_bg'],
-                    fg='#94a3b8',
-                    cursor='hand2'
-                )
-                note_label.place(x=2, y=2)
-                note_label.bind('<Button-1>', lambda e, row=r, col=c: self.select_cell(row, col))
-                
-                self.cells[r][c] = cell
-                self.cell_frames[r][c] = cell_frame
-                self.note_labels[r][c] = note_label
+        # NxN grid oluştur ('canvas' tek bir Canvas üzerine çizer)
+        view_cls = CanvasBoard if self.renderer == 'canvas' else WidgetBoard
+        self.board_view = view_cls(board_bg, self.colors, self.select_cell, box=self.box)
+        self.board_view.pack()
         
         # Sayı butonları
         numbers_frame = tk.Frame(main_frame, bg=self.colors['bg'])
         numbers_frame.pack(pady=(0, 15))
         
-        for num in range(1, 10):
+        # 9'dan fazla rakamda butonlar iki satıra bölünür ve küçülür
+        per_row = self.size if self.size <= 9 else -(-self.size // 2)
+        small = self.size > 9
+        for num in range(1, self.size + 1):
             btn = tk.Button(
                 numbers_frame,
-                text=str(num),
-                font=('Arial', 16, 'bold'),
+                text=SYMBOLS[num - 1],
+                font=('Arial', 12 if small else 16, 'bold'),
                 bg=self.colors['button_bg'],
                 fg=self.colors['text'],
                 activebackground=self.colors['button_hover'],
                 activeforeground=self.colors['text'],
                 relief='flat',
-                width=4,
-                height=2,
+                width=2 if small else 4,
+                height=1 if small else 2,
                 cursor='hand2',
                 command=lambda n=num: self.input_number(n)
             )
-            btn.pack(side='left', padx=3)
+            btn.grid(row=(num - 1) // per_row, column=(num - 1) % per_row, padx=3, pady=2)
             
             # Hover efekti
             btn.bind('<Enter>', lambda e, b=btn: b.config(bg=self.colors['button_hover']))
@@ -208,6 +248,9 @@ class ModernSudoku:
             ("✏️ Notlar", self.toggle_pencil, '#f59e0b'),
             ("💡 İpucu", self.give_hint, '#3b82f6'),
             ("↶ Geri Al", self.undo_move, '#ef4444'),
+            ("↷ Yinele", self.redo_move, '#f97316'),
+            ("✔ Kontrol", self.check_board, '#22c55e'),
+            ("🔢 Kimlik", self.open_puzzle_id, '#14b8a6'),
             ("⏸ Durdur", self.toggle_pause, '#8b5cf6'),
         ]
         
@@ -239,11 +282,14 @@ class ModernSudoku:
         
         # Klavye bağlama
         self.root.bind('<Key>', self.handle_key)
+        self.root.bind('<Control-z>', self.undo_move)
+        self.root.bind('<Control-y>', self.redo_move)
         
         # Bilgi metni
         info = tk.Label(
             main_frame,
-            text="🎮 Ok tuşları | 1-9 sayı gir | Backspace/Delete sil",
+            text=f"🎮 Ok tuşları | {SYMBOLS[0]}-{SYMBOLS[self.size - 1]} sayı gir | "
+                 "Backspace/Delete sil | Ctrl+Z/Ctrl+Y geri al/yinele",
             font=('Arial', 9),
             fg='#c4b5fd',
             bg=self.colors['bg']
@@ -260,165 +306,202 @@ class ModernSudoku:
         return f'#{r:02x}{g:02x}{b:02x}'
     
     def change_difficulty(self, diff):
-        self.difficulty = diff
+        self.engine.difficulty = diff
+        self.highlight_difficulty()
+        self.new_game()
+    
+    def highlight_difficulty(self):
         for d, btn in self.diff_buttons.items():
-            if d == diff:
+            if d == self.engine.difficulty:
                 btn.config(bg=self.colors['button_bg'])
             else:
                 btn.config(bg=self.colors['cell_bg'])
     
-    def is_safe(self, board, row, col, num):
-        for i in range(GRID_SIZE):
-            if board[row][i] == num or board[i][col] == num:
-                return False
-        box_row, box_col = (row // BOX) * BOX, (col // BOX) * BOX
-        for r in range(box_row, box_row + BOX):
-            for c in range(box_col, box_col + BOX):
-                if board[r][c] == num:
-                    return False
-        return True
+    def next_puzzle(self):
+        if self.corpus is not None:
+            return self.corpus.pick(self.engine.difficulty)
+        return self.pool.get(self.engine.difficulty)
     
-    def solve_board(self, board):
-        for r in range(GRID_SIZE):
-            for c in range(GRID_SIZE):
-                if board[r][c] == 0:
-                    for num in range(1, 10):
-                        if self.is_safe(board, r, c, num):
-                            board[r][c] = num
-                            if self.solve_board(board):
-                                return True
-                            board[r][c] = 0
-                    return False
-        return True
+    def wait_for_first_game(self):
+        if self.loaded or self.id_task is not None:
+            return  # Oyuncu bu arada kimlikle bulmaca açtı
+        puzzle = self.next_puzzle()
+        if puzzle is None and self.corpus is None:
+            self.root.after(20, self.wait_for_first_game)
+            return
+        self.new_game(puzzle)
     
-    def generate_sudoku(self):
-        board = [[0]*GRID_SIZE for _ in range(GRID_SIZE)]
-        nums = list(range(1, 10))
-        
-        def fill_board(b):
-            for r in range(GRID_SIZE):
-                for c in range(GRID_SIZE):
-                    if b[r][c] == 0:
-                        random.shuffle(nums)
-                        for num in nums:
-                            if self.is_safe(b, r, c, num):
-                                b[r][c] = num
-                                if fill_board(b):
-                                    return True
-                                b[r][c] = 0
-                        return False
-            return True
-        
-        fill_board(board)
-        solution = [row[:] for row in board]
-        
-        # Hücreleri çıkar
-        cells_to_remove = {'easy': 35, 'medium': 45, 'hard': 55}[self.difficulty]
-        cells = [(r, c) for r in range(GRID_SIZE) for c in range(GRID_SIZE)]
-        random.shuffle(cells)
-        
-        for i in range(min(cells_to_remove, len(cells))):
-            r, c = cells[i]
-            board[r][c] = 0
-        
-        return board, solution
+    def new_game(self, puzzle=None):
+        # Eski tahta için süren çözüm ve kimlikten üretim artık geçersiz
+        self.cancel_solve()
+        self.id_task = None
+        # Hazır bulmaca yoksa motor burada üretir
+        self.engine.new_game(puzzle or self.next_puzzle())
+        self.loaded = True
+        self.start_session(0)
+        self.autosave()
     
-    def new_game(self):
-        self.board, self.solution = self.generate_sudoku()
-        self.initial_board = [row[:] for row in self.board]
+    def start_session(self, elapsed):
         self.selected = None
-        self.notes = [[set() for _ in range(GRID_SIZE)] for _ in range(GRID_SIZE)]
-        self.history = []
-        self.start_time = datetime.now()
-        self.elapsed_time = 0
         self.is_paused = False
+        self.timer.reset(elapsed)
+        self.timer.start()
+        pid = self.engine.puzzle_id
+        self.id_label.config(text=f"#{pid}" if pid else "")
         self.update_board()
     
+    def resume_game(self):
+        """Kayıtlı oyunu yeniden üretmeden yükle; kayıt yoksa ya da uymuyorsa False"""
+        if not self.save_path:
+            return False
+        try:
+            with open(self.save_path, 'rb') as f:
+                engine, elapsed = SudokuEngine.from_bytes(f.read())
+        except (OSError, ValueError):
+            return False
+        if engine.box != self.box or engine.is_solved():
+            return False
+        self.engine = engine
+        self.loaded = True
+        self.highlight_difficulty()
+        self.start_session(elapsed)
+        return True
+    
+    def autosave(self):
+        """Her hamleden sonra durumu yaz; önce geçici dosyaya yazılıp yerine taşınır"""
+        if not self.save_path or not self.loaded:
+            return  # Boş yer tutucu motor kaydedilmez
+        tmp = self.save_path + '.tmp'
+        try:
+            with open(tmp, 'wb') as f:
+                f.write(self.engine.to_bytes(self.timer.elapsed()))
+            os.replace(tmp, self.save_path)
+        except OSError:
+            pass  # Kayıt yazılamazsa oyun kesilmez
+    
+    def on_close(self):
+        self.cancel_solve()
+        if self.pool is not None:
+            self.pool.stop()
+        if not self.engine.is_solved():
+            self.autosave()
+        self.root.destroy()
+    
+    def open_puzzle_id(self):
+        """Kimliği sorulan bulmacayı yeniden üretip başlat"""
+        text = simpledialog.askstring("Bulmaca Kimliği", "Kimlik girin (örn. M3-1CTD9EU):",
+                                      parent=self.root)
+        if not text:
+            return
+        try:
+            _, difficulty, box = parse_puzzle_id(text)
+        except ValueError:
+            messagebox.showerror("Hata", f"Geçersiz bulmaca kimliği: {text}")
+            return
+        if box != self.box:
+            messagebox.showerror("Hata", f"Bu kimlik {box * box}x{box * box} tahta için; "
+                                         f"oyun {self.size}x{self.size}.")
+            return
+        # Puanlı üretim yarım saniyeyi bulabilir; Tk döngüsü dışında yapılır
+        task = self.id_task = Future()
+        threading.Thread(target=self._generate_from_id, args=(text, task),
+                         name='puzzle-id', daemon=True).start()
+        self.id_label.config(text=f"#{text.strip().upper()} …")
+        self.root.after(SOLVE_POLL_MS, self.poll_puzzle_id, task, difficulty)
+    
+    @staticmethod
+    def _generate_from_id(text, task):
+        try:
+            task.set_result(generate_from_id(text))
+        except Exception as exc:
+            task.set_exception(exc)
+    
+    def poll_puzzle_id(self, task, difficulty):
+        if task is not self.id_task:
+            return  # Bu arada yeni oyun başladı
+        if not task.done():
+            self.root.after(SOLVE_POLL_MS, self.poll_puzzle_id, task, difficulty)
+            return
+        self.engine.difficulty = difficulty
+        self.highlight_difficulty()
+        self.new_game(task.result())
+    
+    def copy_puzzle_id(self, event=None):
+        if self.engine.puzzle_id:
+            self.root.clipboard_clear()
+            self.root.clipboard_append(self.engine.puzzle_id)
+    
     def select_cell(self, row, col):
-        if self.is_paused:
+        # Bulmaca yüklenmeden seçim yok; girdi, ipucu ve tuşlar seçime bağlı
+        if self.is_paused or not self.loaded:
             return
         self.selected = (row, col)
         self.update_board()
     
     def update_board(self):
-        for r in range(GRID_SIZE):
-            for c in range(GRID_SIZE):
-                cell = self.cells[r][c]
-                frame = self.cell_frames[r][c]
-                note_label = self.note_labels[r][c]
-                val = self.board[r][c]
-                
-                # Arkaplan rengi
-                if self.selected and self.selected == (r, c):
-                    bg = self.colors['cell_selected']
-                elif self.selected and self.is_same_group(r, c, self.selected[0], self.selected[1]):
-                    bg = self.colors['cell_highlight']
-                elif self.initial_board[r][c] != 0:
-                    bg = self.colors['cell_given']
-                else:
-                    bg = self.colors['cell_bg']
-                
-                frame.config(bg=bg)
-                cell.config(bg=bg)
-                note_label.config(bg=bg)
-                
-                # Değer ve renk
-                if val != 0:
-                    cell.config(text=str(val))
-                    if self.initial_board[r][c] != 0:
-                        cell.config(fg=self.colors['text_given'], font=('Arial', 22, 'bold'))
-                    else:
-                        cell.config(fg=self.colors['text_user'], font=('Arial', 22, 'bold'))
-                    note_label.config(text="")
+        # Yalnızca görünümü değişen hücreler yeniden yapılandırılır
+        render = self.board_view.render
+        for r in range(self.size):
+            for c in range(self.size):
+                render(r, c, *self.cell_state(r, c))
+    
+    def cell_state(self, r, c):
+        """Hücrenin görünümü: (bg, text, fg, note_text)"""
+        engine = self.engine
+        val = engine.board[r][c]
+        
+        # Arkaplan rengi
+        if self.selected and self.selected == (r, c):
+            bg = self.colors['cell_selected']
+        elif self.selected and self.is_same_group(r, c, self.selected[0], self.selected[1]):
+            bg = self.colors['cell_highlight']
+        elif engine.is_given(r, c):
+            bg = self.colors['cell_given']
+        else:
+            bg = self.colors['cell_bg']
+        
+        # Duraklatıldığında tahtayı gizle
+        if self.is_paused:
+            return bg, "", self.colors['text'], ""
+        
+        # Değer ve renk
+        if val != 0:
+            if engine.is_conflict(r, c):
+                fg = self.colors['cell_error']
+            elif engine.is_given(r, c):
+                fg = self.colors['text_given']
+            else:
+                fg = self.colors['text_user']
+            return bg, SYMBOLS[val - 1], fg, ""
+        
+        # Notları göster
+        note_text = ""
+        mask = engine.notes[r][c]
+        if mask:
+            for i in range(1, self.size + 1):
+                if mask & (1 << (i - 1)):
+                    note_text += SYMBOLS[i - 1]
                 else:
-                    cell.config(text="")
-                    # Notları göster
-                    if self.notes[r][c]:
-                        note_text = ""
-                        for i in range(1, 10):
-                            if i in self.notes[r][c]:
-                                note_text += str(i)
-                            else:
-                                note_text += " "
-                            if i % 3 == 0 and i != 9:
-                                note_text += "\n"
-                        note_label.config(text=note_text)
-                    else:
-                        note_label.config(text="")
+                    note_text += " "
+                if i % self.box == 0 and i != self.size:
+                    note_text += "\n"
+        return bg, "", self.colors['text'], note_text
     
     def is_same_group(self, r1, c1, r2, c2):
         if r1 == r2 or c1 == c2:
             return True
-        return (r1 // 3 == r2 // 3) and (c1 // 3 == c2 // 3)
+        box = self.box
+        return (r1 // box == r2 // box) and (c1 // box == c2 // box)
     
     def input_number(self, num):
         if not self.selected or self.is_paused:
             return
         row, col = self.selected
-        if self.initial_board[row][col] != 0:
+        if not self.engine.set_number(row, col, num, self.pencil_mode):
             return
         
-        # Geçmişe kaydet
-        self.history.append({
-            'board': [row[:] for row in self.board],
-            'notes': [row[:] for row in self.notes]
-        })
-        
-        if self.pencil_mode:
-            # Not modu
-            if num in self.notes[row][col]:
-                self.notes[row][col].remove(num)
-            else:
-                self.notes[row][col].add(num)
-        else:
-            # Normal mod
-            if self.board[row][col] == num:
-                self.board[row][col] = 0
-            else:
-                self.board[row][col] = num
-                self.notes[row][col].clear()
-        
         self.update_board()
+        self.autosave()
         self.check_win()
     
     def toggle_pencil(self):
@@ -432,32 +515,74 @@ class ModernSudoku:
         if not self.selected or self.is_paused:
             return
         row, col = self.selected
-        if self.initial_board[row][col] != 0:
+        if self.engine.hint(row, col) is None:
             return
         
-        self.board[row][col] = self.solution[row][col]
-        self.initial_board[row][col] = self.solution[row][col]
         self.update_board()
+        self.autosave()
         self.check_win()
     
-    def undo_move(self):
-        if not self.history:
+    def undo_move(self, event=None):
+        if self.is_paused:
             return
-        last = self.history.pop()
-        self.board = last['board']
-        self.notes = last['notes']
-        self.update_board()
+        if self.engine.undo() is not None:
+            self.update_board()
+            self.autosave()
+            self.check_win()
+    
+    def redo_move(self, event=None):
+        if self.is_paused:
+            return
+        if self.engine.redo() is not None:
+            self.update_board()
+            self.autosave()
+            self.check_win()
+    
+    def start_solve(self, board, on_done, timeout=SOLVE_TIMEOUT):
+        """Tahtayı ayrı süreçte çöz; bitince on_done(task) Tk döngüsünden çağrılır"""
+        self.cancel_solve()
+        self.solve_task = SolveTask(board, self.box, timeout=timeout)
+        self.root.after(SOLVE_POLL_MS, self.poll_solve, self.solve_task, on_done)
+    
+    def poll_solve(self, task, on_done):
+        if task is not self.solve_task:
+            return  # İptal edildi ya da yerine yenisi başladı
+        if not task.poll():
+            self.root.after(SOLVE_POLL_MS, self.poll_solve, task, on_done)
+            return
+        self.solve_task = None
+        on_done(task)
+    
+    def cancel_solve(self):
+        if self.solve_task is not None:
+            self.solve_task.cancel()
+            self.solve_task = None
+    
+    def check_board(self):
+        """Girilen rakamlarla tahtanın hâlâ çözülebilir olup olmadığını arka planda denetle"""
+        if self.is_paused or not self.loaded:
+            return
+        self.start_solve(self.engine.board, self.show_check_result)
+    
+    def show_check_result(self, task):
+        if task.state == 'timeout':
+            messagebox.showwarning("Kontrol", "Kontrol zaman aşımına uğradı.")
+        elif task.state != 'done':
+            messagebox.showerror("Kontrol", "Kontrol tamamlanamadı.")
+        elif task.result is None:
+            messagebox.showwarning("Kontrol", "Tahtada hata var; bu hâliyle çözülemiyor.")
+        else:
+            messagebox.showinfo("Kontrol", "Şimdilik hata yok 👍")
     
     def toggle_pause(self):
+        if not self.loaded or self.engine.is_solved():
+            return
         self.is_paused = not self.is_paused
         if self.is_paused:
-            # Tahtayı gizle
-            for r in range(GRID_SIZE):
-                for c in range(GRID_SIZE):
-                    self.cells[r][c].config(text="")
-                    self.note_labels[r][c].config(text="")
+            self.timer.stop()
         else:
-            self.update_board()
+            self.timer.start()
+        self.update_board()
     
     def handle_key(self, event):
         if not self.selected or self.is_paused:
@@ -465,37 +590,40 @@ class ModernSudoku:
         
         row, col = self.selected
         
-        if event.char in '123456789':
-            self.input_number(int(event.char))
+        key = event.char.upper()
+        if key and key in SYMBOLS[:self.size]:
+            self.input_number(SYMBOLS.index(key) + 1)
         elif event.keysym in ('BackSpace', 'Delete'):
-            if self.initial_board[row][col] == 0:
-                self.board[row][col] = 0
-                self.notes[row][col].clear()
+            if self.engine.clear_cell(row, col):
                 self.update_board()
+                self.autosave()
+                self.check_win()
         elif event.keysym == 'Up' and row > 0:
             self.select_cell(row - 1, col)
-        elif event.keysym == 'Down' and row < 8:
+        elif event.keysym == 'Down' and row < self.size - 1:
             self.select_cell(row + 1, col)
         elif event.keysym == 'Left' and col > 0:
             self.select_cell(row, col - 1)
-        elif event.keysym == 'Right' and col < 8:
+        elif event.keysym == 'Right' and col < self.size - 1:
             self.select_cell(row, col + 1)
     
-    def update_timer(self):
-        if not self.is_paused and self.start_time:
-            elapsed = (datetime.now() - self.start_time).seconds + self.elapsed_time
-            mins = elapsed // 60
-            secs = elapsed % 60
-            self.timer_label.config(text=f"{mins:02d}:{secs:02d}")
-        self.root.after(1000, self.update_timer)
+    def show_time(self, elapsed):
+        elapsed = int(elapsed)
+        mins = elapsed // 60
+        secs = elapsed % 60
+        self.timer_label.config(text=f"{mins:02d}:{secs:02d}")
     
     def check_win(self):
-        for r in range(GRID_SIZE):
-            for c in range(GRID_SIZE):
-                if self.board[r][c] != self.solution[r][c]:
-                    return
+        """Her düzenlemeden sonra çağrılır; kazanılmış oyun bozulursa süre kaldığı yerden sürer"""
+        if not self.engine.is_solved():
+            self.timer.start()
+            return
+        if not self.timer.running:
+            return  # Zaten kazanılmış; tebrik tekrarlanmaz
         
-        elapsed = (datetime.now() - self.start_time).seconds
+        self.timer.stop()
+        self.show_time(self.timer.elapsed())
+        elapsed = int(self.timer.elapsed())
         mins = elapsed // 60
         secs = elapsed % 60
         messagebox.showinfo(
@@ -503,7 +631,28 @@ class ModernSudoku:
             f"Sudoku'yu çözdünüz!\n\nSüre: {mins:02d}:{secs:02d}"
         )
 
-if __name__ == "__main__":
+def main(argv=None):
+    # Toplu üretim için: python engine.py generate ...
+    parser = argparse.ArgumentParser(description="Modern Sudoku")
+    parser.add_argument('--corpus', help="bulmacaları bu derlem dosyasından oku")
+    parser.add_argument('--canvas', action='store_true',
+                        help="tahtayı widget ızgarası yerine tek Canvas ile çiz")
+    parser.add_argument('--size', type=int, choices=[4, 9, 16, 25], default=BOX * BOX,
+                        help="tahta boyutu")
+    parser.add_argument('--new', action='store_true', help="kayıtlı oyunu yükleme")
+    args = parser.parse_args(argv)
+    corpus = None
+    if args.corpus:
+        try:
+            corpus = PuzzleCorpus(args.corpus)
+        except (OSError, ValueError) as exc:
+            parser.error(str(exc))
+
     root = tk.Tk()
-    app = ModernSudoku(root)
-    root.mainloop()
\ No newline at end of file
+    app = ModernSudoku(root, corpus=corpus,
+                       renderer='canvas' if args.canvas else 'widgets',
+                       box=math.isqrt(args.size), resume=not args.new)
+    root.mainloop()
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
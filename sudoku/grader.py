@@ -0,0 +1,245 @@
+"""
+İnsan tekniklerine dayalı Sudoku zorluk puanlayıcı
+
+Teknikler basitten zora sırayla denenir; biri ilerleme sağlayınca en
+basitine dönülür. Hangi tekniklerin kaç kez gerektiği ve toplam puan
+raporlanır. Adaylar hücre başına bitmaske olarak tutulur.
+"""
+
+# (ad, puan, kademe); kademe zorluk sınıfını belirler
+TECHNIQUES = [
+    ('naked_single', 1, 0),
+    ('hidden_single', 2, 0),
+    ('pointing', 10, 1),
+    ('box_line', 10, 1),
+    ('naked_pair', 15, 1),
+    ('hidden_pair', 25, 1),
+    ('naked_triple', 30, 2),
+    ('x_wing', 50, 2),
+]
+TECHNIQUE_SCORES = {name: score for name, score, _ in TECHNIQUES}
+TECHNIQUE_TIERS = {name: tier for name, _, tier in TECHNIQUES}
+GUESS_SCORE = 200  # Mantıkla çözülemeyen tahtalar için eklenen puan
+GRADES = ('easy', 'medium', 'hard')
+
+_layouts = {}
+
+
+def _popcount(m):
+    return bin(m).count('1')
+
+
+def _layout(box):
+    """Birimler (satır, sütun, kutu) ve komşular; kutu boyutuna göre önbelleklenir"""
+    if box in _layouts:
+        return _layouts[box]
+    size = box * box
+    rows = [[r * size + c for c in range(size)] for r in range(size)]
+    cols = [[r * size + c for r in range(size)] for c in range(size)]
+    boxes = [[(br * box + r) * size + bc * box + c for r in range(box) for c in range(box)]
+             for br in range(box) for bc in range(box)]
+    units = rows + cols + boxes
+    peers = []
+    for i in range(size * size):
+        r, c = divmod(i, size)
+        b = (r // box) * box + c // box
+        peers.append(sorted((set(rows[r]) | set(cols[c]) | set(boxes[b])) - {i}))
+    _layouts[box] = (size, rows, cols, boxes, units, peers)
+    return _layouts[box]
+
+
+class LogicSolver:
+    """Tahmin yapmadan, insan teknikleriyle çözmeye çalışan çözücü"""
+
+    def __init__(self, board, box=3):
+        self.size, self.rows, self.cols, self.boxes, self.units, self.peers = _layout(box)
+        self.box = box
+        size = self.size
+        full = (1 << size) - 1
+        self.values = [v for row in board for v in row]
+        self.cands = [0 if v else full for v in self.values]
+        self.used = {}
+        self.valid = True
+        for i, v in enumerate(self.values):
+            if v:
+                bit = 1 << (v - 1)
+                for p in self.peers[i]:
+                    self.cands[p] &= ~bit
+
+    def _place(self, i, v):
+        bit = 1 << (v - 1)
+        self.values[i] = v
+        self.cands[i] = 0
+        for p in self.peers[i]:
+            self.cands[p] &= ~bit
+
+    def _eliminate(self, cells, mask):
+        """cells içindeki hücrelerden mask adaylarını sil; bir şey silindiyse True"""
+        changed = False
+        cands = self.cands
+        for i in cells:
+            if cands[i] & mask:
+                cands[i] &= ~mask
+                changed = True
+        return changed
+
+    # --- Teknikler: her biri ilerleme sağlarsa True döndürür ---
+
+    def naked_single(self):
+        for i, m in enumerate(self.cands):
+            if m and not m & (m - 1):
+                self._place(i, m.bit_length())
+                return True
+        return False
+
+    def hidden_single(self):
+        cands = self.cands
+        for unit in self.units:
+            once = twice = 0
+            for i in unit:
+                m = cands[i]
+                twice |= once & m
+                once |= m
+            only = once & ~twice
+            if only:
+                bit = only & -only
+                for i in unit:
+                    if cands[i] & bit:
+                        self._place(i, bit.bit_length())
+                        return True
+        return False
+
+    def pointing(self):
+        """Kutudaki bir rakam tek satır/sütunda kalmışsa o hattın geri kalanından silinir"""
+        cands, size = self.cands, self.size
+        for unit in self.boxes:
+            for d in range(size):
+                bit = 1 << d
+                cells = [i for i in unit if cands[i] & bit]
+                if len(cells) < 2:
+                    continue
+                rows = {i // size for i in cells}
+                cols = {i % size for i in cells}
+                if len(rows) == 1:
+                    line = [i for i in self.rows[rows.pop()] if i not in unit]
+                    if self._eliminate(line, bit):
+                        return True
+                if len(cols) == 1:
+                    line = [i for i in self.cols[cols.pop()] if i not in unit]
+                    if self._eliminate(line, bit):
+                        return True
+        return False
+
+    def box_line(self):
+        """Satır/sütundaki bir rakam tek kutuda kalmışsa kutunun geri kalanından silinir"""
+        cands, size, box = self.cands, self.size, self.box
+        for line in self.rows + self.cols:
+            for d in range(size):
+                bit = 1 << d
+                cells = [i for i in line if cands[i] & bit]
+                if len(cells) < 2:
+                    continue
+                boxes = {(i // size // box) * box + (i % size) // box for i in cells}
+                if len(boxes) == 1:
+                    rest = [i for i in self.boxes[boxes.pop()] if i not in line]
+                    if self._eliminate(rest, bit):
+                        return True
+        return False
+
+    def naked_pair(self):
+        cands = self.cands
+        for unit in self.units:
+            seen = {}
+            for i in unit:
+                m = cands[i]
+                if m and _popcount(m) == 2:
+                    if m in seen:
+                        other = seen[m]
+                        rest = [j for j in unit if j != i and j != other]
+                        if self._eliminate(rest, m):
+                            return True
+                    else:
+                        seen[m] = i
+        return False
+
+    def hidden_pair(self):
+        cands, size = self.cands, self.size
+        for unit in self.units:
+            places = {}
+            for d in range(size):
+                bit = 1 << d
+                cells = tuple(i for i in unit if cands[i] & bit)
+                if len(cells) == 2:
+                    places.setdefault(cells, []).append(bit)
+            for (a, b), bits in places.items():
+                if len(bits) == 2:
+                    pair = bits[0] | bits[1]
+                    if (cands[a] | cands[b]) & ~pair:
+                        cands[a] &= pair
+                        cands[b] &= pair
+                        return True
+        return False
+
+    def naked_triple(self):
+        cands = self.cands
+        for unit in self.units:
+            small = [i for i in unit if cands[i] and _popcount(cands[i]) <= 3]
+            n = len(small)
+            for x in range(n):
+                for y in range(x + 1, n):
+                    for z in range(y + 1, n):
+                        a, b, c = small[x], small[y], small[z]
+                        m = cands[a] | cands[b] | cands[c]
+                        if _popcount(m) == 3:
+                            rest = [j for j in unit if j not in (a, b, c)]
+                            if self._eliminate(rest, m):
+                                return True
+        return False
+
+    def x_wing(self):
+        cands, size = self.cands, self.size
+        for lines, cross in ((self.rows, self.cols), (self.cols, self.rows)):
+            for d in range(size):
+                bit = 1 << d
+                pairs = {}
+                for li, line in enumerate(lines):
+                    pos = tuple(k for k, i in enumerate(line) if cands[i] & bit)
+                    if len(pos) == 2:
+                        pairs.setdefault(pos, []).append(li)
+                for pos, found in pairs.items():
+                    if len(found) < 2:
+                        continue
+                    keep = {lines[li][k] for li in found[:2] for k in pos}
+                    rest = [i for k in pos for i in cross[k] if i not in keep]
+                    if self._eliminate(rest, bit):
+                        return True
+        return False
+
+    def run(self):
+        """Teknikleri sırayla uygula; tahta çözüldüyse True"""
+        steps = [(name, getattr(self, name)) for name, _, _ in TECHNIQUES]
+        while True:
+            if 0 not in self.values:
+                return True
+            for i, v in enumerate(self.values):
+                if not v and not self.cands[i]:
+                    self.valid = False  # Çelişki: adayı kalmayan boş hücre
+                    return False
+            for name, step in steps:
+                if step():
+                    self.used[name] = self.used.get(name, 0) + 1
+                    break
+            else:
+                return False
+
+
+def grade(board, box=3):
+    """Tahtayı puanla: (sınıf, puan, {teknik: kullanım sayısı})"""
+    solver = LogicSolver(board, box)
+    solved = solver.run()
+    score = sum(TECHNIQUE_SCORES[name] * count for name, count in solver.used.items())
+    tier = max((TECHNIQUE_TIERS[name] for name in solver.used), default=0)
+    if not solved:
+        score += GUESS_SCORE
+        tier = 2
+    return GRADES[tier], score, dict(solver.used)
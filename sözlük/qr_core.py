@@ -0,0 +1,233 @@
+"""
+Sözlük QR çekirdeği - arayüz bağımlılığı yok
+
+Adres oluşturma, QR üretimi, dışa aktarma ve toplu üretim. tkinter
+kullanmaz; qrcode ve PIL ilk QR üretiminde yüklenir, içe aktarma hızlıdır.
+
+Kullanım:
+    python qr_core.py batch kelimeler.txt --dict ldoce --out qr.zip
+    python qr_core.py serve --port 8000
+"""
+import csv
+import io
+import os
+import re
+import sys
+import time
+import urllib.parse
+from collections import OrderedDict
+
+TURENG_BASE = "https://tureng.com/tr/turkce-ingilizce/"
+LDOCE_BASE = "https://www.ldoceonline.com/dictionary/"
+QR_FILL = "#7c4dff"
+# Çizim ayarları: (hata düzeltme, modül pikseli, kenar modülü, ön renk, arka renk)
+QR_STYLE = ('H', 4, 2, QR_FILL, "white")
+QR_CACHE_SIZE = 32  # Önbellekte tutulan en fazla QR
+
+
+def build_url(word, dictionary="Tureng"):
+    """Kelimenin sözlük adresi; kelime boşsa boş dize"""
+    word = word.strip().lower()
+    if not word:
+        return ""
+    
+    safe_word = urllib.parse.quote(word, safe='')
+    
+    if dictionary.lower() == "tureng":
+        return TURENG_BASE + safe_word
+    else:
+        return LDOCE_BASE + safe_word
+
+
+def make_qr(url, style=QR_STYLE):
+    """Kodlanmış QR nesnesi; qrcode (ve onunla PIL) ilk çağrıda yüklenir
+
+    Adres en büyük QR sürümüne sığmıyorsa ValueError.
+    """
+    import qrcode
+
+    level, box_size, border, _, _ = style
+    qr = qrcode.QRCode(version=1, box_size=box_size, border=border,
+                       error_correction=getattr(qrcode.constants, f"ERROR_CORRECT_{level}"))
+    qr.add_data(url)
+    try:
+        qr.make(fit=True)
+    except (ValueError, qrcode.exceptions.DataOverflowError) as e:
+        raise ValueError(f"adres QR'a sığmayacak kadar uzun ({len(url)} karakter)") from e
+    return qr
+
+
+def make_qr_image(url, style=QR_STYLE):
+    """Arayüzle aynı görünümde QR görseli"""
+    _, _, _, fill, back = style
+    return make_qr(url, style).make_image(fill_color=fill, back_color=back)
+
+
+class QRCache:
+    """Sınırlı LRU önbellek; en uzun süre kullanılmayan kayıt önce atılır"""
+
+    def __init__(self, maxsize=QR_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._items = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._items)
+
+    def get(self, key):
+        try:
+            value = self._items[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        self._items.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        self._items[key] = value
+        self._items.move_to_end(key)
+        while len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+
+    def clear(self):
+        self._items.clear()
+
+
+def read_words(path, column=0, header=False):
+    """Metin (satır başına bir kelime) ya da CSV dosyasından tekrarsız kelimeler"""
+    with open(path, encoding='utf-8-sig', newline='') as f:
+        if path.lower().endswith('.csv'):
+            rows = csv.reader(f)
+            if header:
+                next(rows, None)
+            words = (row[column] for row in rows if len(row) > column)
+        else:
+            words = f
+        seen = {}
+        for word in words:
+            word = word.strip()
+            if word and word.lower() not in seen:
+                seen[word.lower()] = word
+    return list(seen.values())
+
+
+def _file_name(word, used, ext):
+    """Kelimeden dosya adı; aynı ada düşen kelimelere sıra eki eklenir"""
+    base = re.sub(r'[^\w-]+', '_', word.lower()).strip('_') or 'qr'
+    name, n = base, 1
+    while name in used:
+        n += 1
+        name = f"{base}_{n}"
+    used.add(name)
+    return f"{name}_qr.{ext}"
+
+
+def image_bytes(url, fmt='png', style=QR_STYLE):
+    """QR görselini PNG ya da JPG baytları olarak döndür"""
+    img = make_qr_image(url, style)
+    with io.BytesIO() as buff:
+        if fmt == 'jpg':
+            img.convert('RGB').save(buff, format='JPEG', quality=95)
+        else:
+            img.save(buff, format='PNG')
+        return buff.getvalue()
+
+
+def save_image(url, path, style=QR_STYLE):
+    """QR görselini dosyaya yaz; biçim uzantıdan anlaşılır (JPG beyaz zeminli RGB)"""
+    make_qr_image(url, style).convert('RGB').save(path, quality=95)
+
+
+def _render_chunk(items, dictionary, fmt):
+    """Süreç havuzunda çalışır: (dosya adı, kelime) listesini görsel baytlarına çevir"""
+    return [(name, image_bytes(build_url(word, dictionary), fmt)) for name, word in items]
+
+
+def batch(words, dictionary, out, fmt='png', workers=None, chunk=None):
+    """Kelimelerin QR kodlarını süreçlere dağıtarak üret
+
+    out '.zip' ile bitiyorsa tek bir ZIP, değilse klasör yazılır.
+    İlerleme ve hız stderr'e basılır; yazılan dosya sayısı döner.
+    """
+    import zipfile
+    from concurrent.futures import ProcessPoolExecutor
+
+    used = set()
+    items = [(_file_name(word, used, fmt), word) for word in words]
+    if chunk is None:
+        # Çekirdek başına birkaç parça düşsün; küçük listelerde de tüm çekirdekler çalışır
+        chunk = max(1, min(64, len(items) // ((workers or os.cpu_count() or 1) * 4)))
+    chunks = [items[i:i + chunk] for i in range(0, len(items), chunk)]
+    to_zip = out.lower().endswith('.zip')
+    if not to_zip:
+        os.makedirs(out, exist_ok=True)
+
+    done = 0
+    start = time.perf_counter()
+    # PNG/JPG zaten sıkıştırılmış; ZIP içinde yeniden sıkıştırılmaz
+    archive = zipfile.ZipFile(out, 'w', zipfile.ZIP_STORED) if to_zip else None
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for rendered in executor.map(_render_chunk, chunks, [dictionary] * len(chunks),
+                                         [fmt] * len(chunks)):
+                for name, data in rendered:
+                    if archive is not None:
+                        archive.writestr(name, data)
+                    else:
+                        with open(os.path.join(out, name), 'wb') as f:
+                            f.write(data)
+                done += len(rendered)
+                rate = done / (time.perf_counter() - start)
+                print(f"\r{done}/{len(items)} QR ({rate:.0f}/sn)", end='', file=sys.stderr,
+                      flush=True)
+    finally:
+        if archive is not None:
+            archive.close()
+    print(file=sys.stderr)
+    return done
+
+
+def run_batch(args):
+    batch(read_words(args.words, args.column, args.header), args.dict, args.out, args.format,
+          args.workers)
+
+
+def run_serve(args):
+    from qr_server import serve
+
+    serve(args.host, args.port, args.cache, args.verbose)
+
+
+def add_commands(sub):
+    """Arayüzsüz alt komutları bir argparse alt ayrıştırıcısına ekle"""
+    bat = sub.add_parser('batch', help="kelime listesinden toplu QR üret (arayüzsüz)")
+    bat.add_argument('words', help="metin (satır başına bir kelime) ya da CSV dosyası")
+    bat.add_argument('--dict', choices=['tureng', 'ldoce'], default='tureng')
+    bat.add_argument('--out', required=True, help="klasör ya da .zip dosyası")
+    bat.add_argument('--format', choices=['png', 'jpg'], default='png')
+    bat.add_argument('--column', type=int, default=0, help="CSV'de kelime sütunu")
+    bat.add_argument('--header', action='store_true', help="CSV'nin ilk satırı başlıktır")
+    bat.add_argument('--workers', type=int, default=None)
+    bat.set_defaults(func=run_batch)
+    srv = sub.add_parser('serve', help="QR kodlarını HTTP ile sun (GET /qr?dict=...&word=...)")
+    srv.add_argument('--host', default='127.0.0.1')
+    srv.add_argument('--port', type=int, default=8000)
+    srv.add_argument('--cache', type=int, default=4096, help="önbellekteki en fazla yanıt")
+    srv.add_argument('--verbose', action='store_true', help="her isteği günlüğe yaz")
+    srv.set_defaults(func=run_serve)
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Arayüzsüz sözlük QR araçları")
+    sub = parser.add_subparsers(dest='command', required=True)
+    add_commands(sub)
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,21 +2,23 @@
 Modern ve Şık Sözlük QR Oluşturucu
 Mor-Mavi Tema
 
+Arayüzsüz işler (adres, QR üretimi, toplu üretim) qr_core modülündedir.
+
 Kullanım:
     pip install qrcode[pil] pillow
-    python dictionary_qr_gui.py
+    python qr_maker.py
+    python qr_maker.py batch kelimeler.txt --dict ldoce --out qr.zip
+    python qr_maker.py serve --port 8000
 """
 # pyinstaller --onefile --windowed --name "QR_Sozluk" --icon=64.ico qr_maker.py
-import io
-import urllib.parse
+import argparse
 import tkinter as tk
 from tkinter import messagebox, ttk, filedialog
 
-import qrcode
-from PIL import Image, ImageTk
+import qr_core
+from qr_core import QR_STYLE, QRCache, build_url, make_qr
 
-TURENG_BASE = "https://tureng.com/tr/turkce-ingilizce/"
-LDOCE_BASE = "https://www.ldoceonline.com/dictionary/"
+PREVIEW_SIZE = 200  # Önizleme küçük resminin en büyük kenarı
 
 
 class ModernQRApp:
@@ -143,7 +145,9 @@ class ModernQRApp:
 
         self._photo = None
         self._placeholder_active = True
-        self._current_qr_image = None  # QR görselini saklamak için
+        self._current_url = None  # Kaydedilecek QR'ın adresi; görsel kayıtta üretilir
+        # (adres, stil, önizleme boyutu) -> (modül matrisi, önizleme)
+        self._cache = QRCache()
 
     def _clear_placeholder(self, event):
         if self._placeholder_active:
@@ -158,16 +162,9 @@ class ModernQRApp:
             self._placeholder_active = True
 
     def _build_url(self, word):
-        word = word.strip().lower()
-        if not word or word == "kelime girin...":
+        if word.strip().lower() == "kelime girin...":
             return ""
-        
-        safe_word = urllib.parse.quote(word, safe='')
-        
-        if self.dict_var.get() == "Tureng":
-            return TURENG_BASE + safe_word
-        else:
-            return LDOCE_BASE + safe_word
+        return build_url(word, self.dict_var.get())
 
     def generate_qr(self):
         url = self._build_url(self.entry.get())
@@ -177,29 +174,37 @@ class ModernQRApp:
             return
 
         try:
-            qr = qrcode.QRCode(version=1, error_correction=qrcode.constants.ERROR_CORRECT_H,
-                              box_size=4, border=2)
-            qr.add_data(url)
-            qr.make(fit=True)
-            img = qr.make_image(fill_color="#7c4dff", back_color="white")
+            key = (url, QR_STYLE, PREVIEW_SIZE)
+            entry = self._cache.get(key)
+            if entry is None:
+                entry = self._render(url)
+                self._cache.put(key, entry)
             
-            # Orijinal QR görselini sakla
-            self._current_qr_image = img
-
-            with io.BytesIO() as buff:
-                img.save(buff, format="PNG")
-                buff.seek(0)
-                pil_img = Image.open(buff)
-                pil_img.thumbnail((200, 200), Image.Resampling.LANCZOS)
-                
-                self._photo = ImageTk.PhotoImage(pil_img)
-                self.qr_label.config(image=self._photo)
+            _, self._photo = entry
+            self._current_url = url
+            self.qr_label.config(image=self._photo)
                                      
         except Exception as e:
             messagebox.showerror("❌ Hata", f"QR oluşturulamadı:\n{e}")
 
+    def _render(self, url):
+        """(modül matrisi, önizleme) üret
+
+        Matris modül başına bir piksel olarak PhotoImage'a yazılır ve
+        önizlemeye sığan en büyük tam sayı katıyla büyütülür; PNG'ye
+        kodlama ve yeniden örnekleme yapılmaz, kenarlar keskin kalır.
+        """
+        matrix = make_qr(url).get_matrix()
+        _, _, _, fill, back = QR_STYLE
+        n = len(matrix)
+        pixels = tk.PhotoImage(master=self.root, width=n, height=n)
+        pixels.put(' '.join('{' + ' '.join(fill if dark else back for dark in row) + '}'
+                            for row in matrix))
+        scale = max(1, PREVIEW_SIZE // n)
+        return matrix, pixels.zoom(scale) if scale > 1 else pixels
+
     def save_qr(self):
-        if self._current_qr_image is None:
+        if self._current_url is None:
             messagebox.showwarning("✨ Uyarı", "Önce bir QR kod oluşturun!")
             return
         
@@ -216,8 +221,7 @@ class ModernQRApp:
         if filename:
             try:
                 # QR kodunu beyaz arka plana çevir ve JPG olarak kaydet
-                rgb_img = self._current_qr_image.convert('RGB')
-                rgb_img.save(filename, quality=95)
+                qr_core.save_image(self._current_url, filename)
                 messagebox.showinfo("✨ Başarılı", f"QR kod kaydedildi:\n{filename}")
             except Exception as e:
                 messagebox.showerror("❌ Hata", f"Kaydetme hatası:\n{e}")
@@ -229,11 +233,24 @@ class ModernQRApp:
         self._placeholder_active = True
         self.qr_label.config(image="")
         self._photo = None
-        self._current_qr_image = None
+        self._current_url = None
         self.entry.focus_set()
 
 
-if __name__ == "__main__":
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sözlük QR oluşturucu")
+    sub = parser.add_subparsers(dest='command')
+    qr_core.add_commands(sub)
+    args = parser.parse_args(argv)
+
+    if args.command:
+        args.func(args)
+        return
+
     root = tk.Tk()
     app = ModernQRApp(root)
-    root.mainloop()
\ No newline at end of file
+    root.mainloop()
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
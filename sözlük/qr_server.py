@@ -0,0 +1,159 @@
+"""
+Sözlük QR HTTP servisi - arayüz bağımlılığı yok
+
+    GET /qr?dict=tureng&word=merhaba&fmt=png
+
+Aynı anda gelen özdeş istekler tek bir çizime bağlanır; sonuçlar bellekte
+LRU önbellekte tutulur ve ETag ile tekrar istekler 304 alır.
+
+Kullanım:
+    python qr_maker.py serve --port 8000
+"""
+import hashlib
+import sys
+import threading
+import urllib.parse
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from qr_core import QR_STYLE, QRCache, build_url, image_bytes
+
+SERVER_CACHE_SIZE = 4096  # Önbellekte tutulan en fazla yanıt (PNG başına ~1-3 KB)
+CONTENT_TYPES = {'png': 'image/png', 'jpg': 'image/jpeg'}
+DICTIONARIES = ('tureng', 'ldoce')
+CACHE_CONTROL = 'public, max-age=86400'  # Aynı adresin QR'ı değişmez
+
+
+class QRService:
+    """İş parçacığı güvenli QR üretici: önbellek + özdeş isteklerin birleştirilmesi"""
+
+    def __init__(self, cache_size=SERVER_CACHE_SIZE):
+        self._cache = QRCache(cache_size)
+        self._inflight = {}  # anahtar -> Future; ilk istek çizer, diğerleri bekler
+        self._lock = threading.Lock()
+        self.renders = 0
+
+    def get(self, url, fmt):
+        """(gövde, etag) döndür; gerekiyorsa yalnızca bir iş parçacığı çizer
+
+        Kodlanamayan adres (ör. çok uzun kelime) için ValueError; bu sonuç da
+        önbelleğe alınır ve tekrar çizilmez.
+        """
+        key = (url, fmt, QR_STYLE)
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                return self._unwrap(entry)
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+        if not owner:
+            return self._unwrap(future.result())
+
+        try:
+            body = image_bytes(url, fmt)
+            entry = body, '"' + hashlib.sha1(body).hexdigest()[:20] + '"'
+        except ValueError as e:
+            entry = e
+        except Exception as e:
+            with self._lock:
+                del self._inflight[key]
+            future.set_exception(e)
+            raise
+        with self._lock:
+            self.renders += 1
+            self._cache.put(key, entry)
+            del self._inflight[key]
+        future.set_result(entry)
+        return self._unwrap(entry)
+
+    @staticmethod
+    def _unwrap(entry):
+        if isinstance(entry, ValueError):
+            raise ValueError(str(entry))
+        return entry
+
+
+def etag_matches(header, etag):
+    """If-None-Match başlığı (virgülle ayrılmış liste ya da '*') etag'i kapsıyor mu"""
+    if not header:
+        return False
+    tags = [tag.strip() for tag in header.split(',')]
+    # If-None-Match zayıf karşılaştırma kullanır; W/ öneki yok sayılır
+    return '*' in tags or any(tag.removeprefix('W/') == etag for tag in tags)
+
+
+class QRRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # Bağlantı açık kalır; tabletler aynı soketi kullanır
+    server_version = 'QRSozluk/1.0'
+    disable_nagle_algorithm = True  # Başlık ve gövde ayrı yazılır; gecikmeli ACK beklenmesin
+
+    def do_GET(self):
+        parsed = urllib.parse.urlsplit(self.path)
+        if parsed.path != '/qr':
+            self._send_error(404, "bulunamadı")
+            return
+        query = urllib.parse.parse_qs(parsed.query)
+        dictionary = query.get('dict', ['tureng'])[0].lower()
+        fmt = query.get('fmt', ['png'])[0].lower()
+        url = build_url(query.get('word', [''])[0], dictionary)
+        if not url or dictionary not in DICTIONARIES or fmt not in CONTENT_TYPES:
+            self._send_error(400, "kullanım: /qr?dict=tureng|ldoce&word=...&fmt=png|jpg")
+            return
+
+        try:
+            body, etag = self.server.service.get(url, fmt)
+        except ValueError as e:
+            self._send_error(400, f"QR oluşturulamadı: {e}")
+            return
+        except Exception as e:
+            self._send_error(500, f"QR oluşturulamadı: {e}")
+            return
+
+        if etag_matches(self.headers.get('If-None-Match'), etag):
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', CACHE_CONTROL)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', CONTENT_TYPES[fmt])
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', etag)
+        self.send_header('Cache-Control', CACHE_CONTROL)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_error(self, code, message):
+        body = message.encode('utf-8')
+        self.send_response(code)
+        self.send_header('Content-Type', 'text/plain; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+def make_server(host='127.0.0.1', port=8000, cache_size=SERVER_CACHE_SIZE, verbose=False):
+    server = ThreadingHTTPServer((host, port), QRRequestHandler)
+    server.daemon_threads = True
+    server.service = QRService(cache_size)
+    server.verbose = verbose
+    return server
+
+
+def serve(host='127.0.0.1', port=8000, cache_size=SERVER_CACHE_SIZE, verbose=False):
+    server = make_server(host, port, cache_size, verbose)
+    print(f"QR servisi: http://{host}:{server.server_port}/qr?dict=tureng&word=merhaba",
+          file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()